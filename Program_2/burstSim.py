@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+# burstSim.py
+# Jobs that alternate CPU and I/O bursts: "5,3,2 0" arrives at 0, runs 5, blocks on I/O
+# for 3, then runs 2 more. A job that ends a CPU burst leaves the ready queue until its
+# I/O is done and then wakes up like a new arrival. The CPU moves from event to event:
+# arrivals come off the arrival cursor and I/O completions off a heap, and a policy
+# object decides what runs next and for how long. With one burst per job every policy
+# gives the same schedule as its engine in schedSim.
+#
+# ReadyPolicy is also the plugin interface: a subclass passed to SchedulerSimulator as
+# policy=, or named on the command line with --plugin module:Class, runs on this engine
+# in place of the built-in policies. An Observer attached to a run sees each dispatch,
+# preemption and completion, and every policy callback is timed while it is attached.
+import os
+import sys
+import time
+import heapq
+import random
+import importlib
+from array import array
+from collections import deque
+
+from schedSim import REALTIME_POLICIES, STRIDE1, VRUNTIME_SCALE, ScheduleType, TicketTree
+
+INF = float('inf')
+
+class ReadyPolicy:
+    # on_arrival() takes a job that became ready (new, or back from I/O when woken is True)
+    # and pick_next() returns the job to run; len() is the number of ready jobs. The engine
+    # runs it for at most slice() and, when cut() says so, only until the next job wakes.
+    # Then on_preempt() puts it back if its burst has time left, or on_leave() lets it go
+    # when it blocks or completes (done is True). tick() runs before every pick
+    arrivals_first = False  # Wake jobs before a preempted job is requeued
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.sim = engine.sim
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def on_arrival(self, job, woken):
+        raise NotImplementedError
+
+    def pick_next(self):
+        raise NotImplementedError
+
+    def slice(self, job):
+        return INF
+
+    def cut(self, job):
+        return False
+
+    def tick(self):
+        pass
+
+    def on_preempt(self, job, ran):
+        pass
+
+    def on_leave(self, job, ran, done):
+        pass
+
+class FifoPolicy(ReadyPolicy):
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def on_arrival(self, job, woken):
+        self.queue.append(job)
+
+    def pick_next(self):
+        return self.queue.popleft()
+
+class RoundRobinPolicy(FifoPolicy):
+    arrivals_first = True  # Jobs that wake during the slice go ahead of the preempted job
+
+    def slice(self, job):
+        return self.sim.quantum
+
+    def on_preempt(self, job, ran):
+        self.queue.append(job)
+
+class ShortestBurstPolicy(ReadyPolicy): # SRTN over the remaining time of the current CPU burst
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.ready = []
+
+    def __len__(self):
+        return len(self.ready)
+
+    def on_arrival(self, job, woken):
+        heapq.heappush(self.ready, (self.engine.burst_left[job], job))
+
+    def pick_next(self):
+        return heapq.heappop(self.ready)[1]
+
+    def cut(self, job):
+        return True
+
+    def on_preempt(self, job, ran):
+        self.on_arrival(job, False)
+
+class FeedbackPolicy(ReadyPolicy):
+    # MLFQ as in schedSim. A job keeps its level and allotment use across I/O, and a
+    # boost reaches blocked jobs through an epoch counter checked when they wake
+    arrivals_first = True
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        jobs = len(self.sim.jobs)
+        self.quanta = self.sim.level_quanta
+        self.levels = [deque() for _ in self.quanta]
+        self.waiting = 0
+        self.level = array('l', [0]) * jobs
+        self.used = array('q', [0]) * jobs
+        self.epoch = array('l', [0]) * jobs
+        self.boosts = 0
+        self.next_boost = self.sim.boost or INF
+        self.running_level = 0
+
+    def __len__(self):
+        return self.waiting
+
+    def on_arrival(self, job, woken):
+        if woken and self.epoch[job] < self.boosts and self.level[job]:
+            self.level[job] = 0  # Boosted while blocked
+            self.used[job] = 0
+        self.epoch[job] = self.boosts
+        self.enqueue(job, self.level[job])
+
+    def enqueue(self, job, k, first=False):
+        if first:
+            self.levels[k].appendleft(job)
+        else:
+            self.levels[k].append(job)
+        self.waiting |= 1 << k
+
+    def tick(self):
+        now = self.sim.current_time
+        if now < self.next_boost:
+            return
+        for level in self.levels[1:]:
+            for job in level:
+                self.level[job] = 0
+                self.used[job] = 0
+            self.levels[0].extend(level)
+            level.clear()
+        self.waiting = 1 if self.levels[0] else 0
+        self.boosts += 1
+        self.next_boost += ((now - self.next_boost) // self.sim.boost + 1) * self.sim.boost
+
+    def pick_next(self):
+        k = (self.waiting & -self.waiting).bit_length() - 1
+        queue = self.levels[k]
+        job = queue.popleft()
+        if not queue:
+            self.waiting ^= 1 << k
+        self.running_level = k
+        return job
+
+    def slice(self, job):
+        quantum = self.quanta[self.running_level]
+        return min(quantum - self.used[job] % quantum, max(0, self.next_boost - self.sim.current_time))
+
+    def cut(self, job):
+        return self.running_level > 0  # Any waking job starts at or above this level
+
+    def charge(self, job, ran): # Returns the level the job belongs to after this slice
+        k = self.running_level
+        self.used[job] += ran
+        if k < len(self.quanta) - 1 and self.used[job] >= self.sim.allotment * self.quanta[k]:
+            self.used[job] = 0  # Allotment spent: move down a level
+            k += 1
+        self.level[job] = k
+        return k
+
+    def on_preempt(self, job, ran):
+        k = self.running_level
+        if self.charge(job, ran) > k:
+            self.enqueue(job, k + 1)
+        else:
+            self.enqueue(job, k, first=not ran or self.used[job] % self.quanta[k] != 0)  # Preempted mid-quantum
+
+    def on_leave(self, job, ran, done):
+        if not done:
+            self.charge(job, ran)
+
+class FairPolicy(ReadyPolicy): # CFS; a waking job resumes at no less than min_vruntime
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.weight = self.sim.job_weights()
+        self.vruntime = array('q', [0]) * len(self.sim.jobs)
+        self.ready = []
+        self.load = 0
+        self.min_vruntime = 0
+        self.latency_jobs = self.sim.latency // self.sim.granularity
+
+    def __len__(self):
+        return len(self.ready)
+
+    def on_arrival(self, job, woken):
+        vruntime = max(self.vruntime[job], self.min_vruntime) if woken else self.min_vruntime
+        self.vruntime[job] = vruntime
+        heapq.heappush(self.ready, (vruntime, job))
+        self.load += self.weight[job]
+
+    def pick_next(self):
+        return self.ready[0][1]  # Stays on the heap while it runs
+
+    def slice(self, job):
+        running = len(self.ready)
+        period = self.sim.latency if running <= self.latency_jobs else running * self.sim.granularity
+        return max(period * self.weight[job] // self.load, self.sim.granularity)
+
+    def on_preempt(self, job, ran):
+        self.vruntime[job] += ran * VRUNTIME_SCALE // self.weight[job]
+        heapq.heapreplace(self.ready, (self.vruntime[job], job))
+        self.update_min_vruntime()
+
+    def on_leave(self, job, ran, done):
+        self.vruntime[job] += ran * VRUNTIME_SCALE // self.weight[job]
+        heapq.heappop(self.ready)
+        self.load -= self.weight[job]
+        self.update_min_vruntime()
+
+    def update_min_vruntime(self):
+        if self.ready:
+            self.min_vruntime = max(self.min_vruntime, self.ready[0][0])
+
+class LotteryPolicy(ReadyPolicy):
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.tickets = self.sim.job_weights()
+        self.ready = TicketTree(len(self.sim.jobs))
+        self.waiting = 0
+        self.draws = random.Random(self.sim.seed)
+        self.alone = False
+
+    def __len__(self):
+        return self.waiting
+
+    def on_arrival(self, job, woken):
+        self.ready.add(job, self.tickets[job])
+        self.waiting += 1
+
+    def pick_next(self):
+        self.alone = self.waiting == 1  # Every draw would pick it anyway
+        if self.alone:
+            return self.ready.holder(0)
+        return self.ready.holder(self.draws.randrange(self.ready.total))
+
+    def slice(self, job):
+        return self.engine.uncontended_slice() if self.alone else self.sim.quantum
+
+    def on_leave(self, job, ran, done):
+        self.ready.add(job, -self.tickets[job])
+        self.waiting -= 1
+
+class StridePolicy(ReadyPolicy): # A waking job resumes at no less than the global pass
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.strides = [STRIDE1 // tickets for tickets in self.sim.job_weights()]
+        self.passes = array('q', [0]) * len(self.sim.jobs)
+        self.ready = []
+        self.global_pass = 0
+
+    def __len__(self):
+        return len(self.ready)
+
+    def on_arrival(self, job, woken):
+        current_pass = max(self.passes[job], self.global_pass) if woken else self.global_pass
+        self.passes[job] = current_pass
+        heapq.heappush(self.ready, (current_pass, job))
+
+    def pick_next(self):
+        return self.ready[0][1]
+
+    def slice(self, job):
+        return self.engine.uncontended_slice() if len(self.ready) == 1 else self.sim.quantum
+
+    def charge(self, job, ran):
+        self.passes[job] += ran * self.strides[job] // self.sim.quantum
+
+    def on_preempt(self, job, ran):
+        self.charge(job, ran)
+        heapq.heapreplace(self.ready, (self.passes[job], job))
+        self.update_global_pass()
+
+    def on_leave(self, job, ran, done):
+        self.charge(job, ran)
+        heapq.heappop(self.ready)
+        self.update_global_pass()
+
+    def update_global_pass(self):
+        if self.ready:
+            self.global_pass = max(self.global_pass, self.ready[0][0])
+
+class DeadlinePolicy(ShortestBurstPolicy): # EDF and RM with a fixed priority per job
+    def __init__(self, engine):
+        super().__init__(engine)
+        jobs = self.sim.jobs
+        deadline = jobs.deadline or array('q', [0]) * len(jobs)
+        period = jobs.period or array('q', [0]) * len(jobs)
+        self.deadline = [d or p or INF for d, p in zip(deadline, period)]
+        if self.sim.algorithm == ScheduleType.EDF:
+            self.priority = [a + d for a, d in zip(jobs.arrival_time, self.deadline)]
+        else:
+            self.priority = [p or d for p, d in zip(period, self.deadline)]
+
+    def on_arrival(self, job, woken):
+        heapq.heappush(self.ready, (self.priority[job], job))
+
+class RankedPolicy(ReadyPolicy): # SJF on the next CPU burst, HRRN and PRIORITY; a burst runs to its end
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.ready = self.sim.ready_heap(engine.burst_left)
+
+    def __len__(self):
+        return len(self.ready)
+
+    def on_arrival(self, job, woken): # Waiting counts from the arrival or the end of the I/O
+        self.ready.push(job, self.engine.io_done[job] if woken else self.sim.jobs.arrival_time[job])
+
+    def tick(self):
+        self.ready.advance(self.sim.current_time)
+
+    def pick_next(self):
+        return self.ready.pop()
+
+POLICIES = {
+    ScheduleType.FIFO: FifoPolicy,
+    ScheduleType.SRTN: ShortestBurstPolicy,
+    ScheduleType.RR: RoundRobinPolicy,
+    ScheduleType.MLFQ: FeedbackPolicy,
+    ScheduleType.CFS: FairPolicy,
+    ScheduleType.LOTTERY: LotteryPolicy,
+    ScheduleType.STRIDE: StridePolicy,
+    ScheduleType.EDF: DeadlinePolicy,
+    ScheduleType.RM: DeadlinePolicy,
+    ScheduleType.SJF: RankedPolicy,
+    ScheduleType.HRRN: RankedPolicy,
+    ScheduleType.PRIORITY: RankedPolicy,
+}
+
+def load_policy(spec): # "module:Class", the module importable from the working directory
+    module_name, _, class_name = spec.partition(':')
+    if not module_name or not class_name:
+        raise ValueError(f"Plugin '{spec}' is not of the form module:Class")
+    if os.getcwd() not in sys.path:
+        sys.path.append(os.getcwd())
+    try:
+        policy = getattr(importlib.import_module(module_name), class_name)
+    except ImportError as e:
+        raise ValueError(f"Cannot import plugin module '{module_name}': {e}")
+    except AttributeError:
+        raise ValueError(f"Module '{module_name}' has no class '{class_name}'")
+    if not (isinstance(policy, type) and issubclass(policy, ReadyPolicy)):
+        raise ValueError(f"Plugin '{spec}' is not a burstSim.ReadyPolicy subclass")
+    return policy
+
+POLICY_CALLBACKS = ('on_arrival', 'pick_next', 'slice', 'cut', 'tick', 'on_preempt', 'on_leave')
+
+class Observer:
+    # Subclass and override the events of interest. While attached, timings maps each
+    # policy callback to [calls, nanoseconds] over the engine's calls to it; a callback
+    # the policy makes itself is part of its caller's time, so the shares add up
+    def __init__(self):
+        self.timings = {}
+
+    def dispatch(self, job, now, run_time):
+        pass
+
+    def preempt(self, job, now):
+        pass
+
+    def complete(self, job, now):
+        pass
+
+class ProfileObserver(Observer): # Counts events and reports where the policy's time went
+    def __init__(self):
+        super().__init__()
+        self.dispatches = 0
+        self.preemptions = 0
+        self.completions = 0
+
+    def dispatch(self, job, now, run_time):
+        self.dispatches += 1
+
+    def preempt(self, job, now):
+        self.preemptions += 1
+
+    def complete(self, job, now):
+        self.completions += 1
+
+    def print_report(self):
+        print(f"Events -- Dispatch {self.dispatches}  Preempt {self.preemptions}  Complete {self.completions}")
+        total = sum(ns for _, ns in self.timings.values())
+        print(f"{'Callback':<12}{'Calls':>12}{'Total ms':>12}{'Mean ns':>10}{'Share':>9}")
+        for name, (calls, ns) in self.timings.items():
+            print(f"{name:<12}{calls:>12}{ns / 1e6:>12.2f}{ns / calls if calls else 0:>10.0f}"
+                  f"{100.0 * ns / total if total else 0:>8.2f}%")
+
+def timed(callback, counter): # Wraps a bound policy callback to add to counter = [calls, ns]
+    clock = time.perf_counter_ns
+    def call(*args):
+        start = clock()
+        result = callback(*args)
+        counter[1] += clock() - start
+        counter[0] += 1
+        return result
+    return call
+
+class TimedPolicy: # Stands in for the policy at the engine's call sites only
+    def __init__(self, policy, timings):
+        self.policy = policy
+        for name in POLICY_CALLBACKS:
+            setattr(self, name, timed(getattr(policy, name), timings.setdefault(name, [0, 0])))
+
+    def __getattr__(self, name):
+        return getattr(self.policy, name)
+
+    def __len__(self):
+        return len(self.policy)
+
+class EventEngine:
+    # Drives a SchedulerSimulator whose jobs may block on I/O. State is per job: which
+    # burst it is on and how much of it is left, plus a heap of (I/O done time, job)
+    def __init__(self, sim):
+        self.sim = sim
+        jobs = sim.jobs
+        self.bursts = jobs.bursts or [None] * len(jobs)
+        self.phase = array('l', [0]) * len(jobs)  # Index of the job's current burst
+        self.burst_left = array('q', jobs.run_time if jobs.bursts is None else
+                                [b[0] if b else r for b, r in zip(jobs.bursts, jobs.run_time)])
+        self.blocked = []  # heap of (I/O done time, job)
+        self.io_done = array('q', [0]) * len(jobs)  # When each job's last I/O finished
+        self.policy = (sim.policy or POLICIES[sim.algorithm])(self)
+        self.observer = sim.observer
+        # The engine calls the policy through calls, so only an observed run pays for timing
+        self.calls = self.policy if self.observer is None else TimedPolicy(self.policy, self.observer.timings)
+
+    def next_wakeup(self):
+        return min(self.sim.arriving_job(), self.blocked[0][0] if self.blocked else INF)
+
+    def wake(self): # Arrivals and I/O completions up to now, in time order, arrivals first on ties
+        sim, blocked, policy = self.sim, self.blocked, self.calls
+        while True:
+            arrival = sim.arriving_job()
+            io_done = blocked[0][0] if blocked else INF
+            if min(arrival, io_done) > sim.current_time:
+                return
+            if arrival <= io_done:
+                policy.on_arrival(sim.next_arrival, False)
+                sim.next_arrival += 1
+            else:
+                policy.on_arrival(heapq.heappop(blocked)[1], True)
+
+    def uncontended_slice(self): # Whole quanta a lone ready job runs before anyone wakes
+        next_wakeup = self.next_wakeup()
+        if next_wakeup == INF:
+            return INF
+        return max(1, -(-(next_wakeup - self.sim.current_time) // self.sim.quantum)) * self.sim.quantum
+
+    def run(self):
+        sim, policy, observer = self.sim, self.calls, self.observer
+        job_count = len(sim.jobs)
+        finish = []  # Completed jobs, for the real-time accounting
+        while sim.completed_jobs < job_count:
+            self.wake()
+            policy.tick()
+            if not policy:
+                next_wakeup = self.next_wakeup()
+                if next_wakeup == INF:
+                    break  # No more jobs
+                sim.current_time = next_wakeup
+                continue
+
+            job = policy.pick_next()
+            if sim.costs and job != sim.last_job:
+                sim.switch_to(job)  # First, so a cut slice still ends at the next wakeup
+            run_time = min(policy.slice(job), self.burst_left[job])
+            if policy.cut(job):
+                run_time = min(run_time, max(0, self.next_wakeup() - sim.current_time))
+            if not run_time and self.burst_left[job]:
+                # The switch ran up to or past the next wakeup: nothing ran, and the job
+                # competes again with whoever woke
+                if policy.arrivals_first:
+                    self.wake()
+                policy.on_preempt(job, 0)
+                continue
+            if observer is not None:
+                observer.dispatch(job, sim.current_time, run_time)
+            self.burst_left[job] -= run_time
+            if sim.run(job, run_time):
+                policy.on_leave(job, run_time, True)
+                finish.append(job)
+                if observer is not None:
+                    observer.complete(job, sim.current_time)
+            elif self.burst_left[job] == 0:
+                policy.on_leave(job, run_time, False)
+                self.block(job)
+            else:
+                if policy.arrivals_first:
+                    self.wake()
+                policy.on_preempt(job, run_time)
+                if observer is not None:
+                    observer.preempt(job, sim.current_time)
+
+        if sim.algorithm in REALTIME_POLICIES and sim.policy is None:
+            self.deadline_results(finish)
+
+    def block(self, job): # Ends a CPU burst: start the I/O and line up the next CPU burst
+        phase = self.phase[job] + 2
+        bursts = self.bursts[job]
+        self.phase[job] = phase
+        self.burst_left[job] = bursts[phase]
+        self.io_done[job] = self.sim.current_time + bursts[phase - 1]
+        heapq.heappush(self.blocked, (self.io_done[job], job))
+
+    def deadline_results(self, finish): # One instance per job, in the shape EDF and RM report
+        sim = self.sim
+        jobs = sim.jobs
+        tat, wt, rt = sim.job_metrics()
+        deadline = self.policy.deadline
+        misses = array('q', [0]) * len(jobs)
+        for job in finish:
+            if jobs.finish_time[job] > jobs.arrival_time[job] + deadline[job]:
+                misses[job] = 1
+        sim.realtime_results = (array('q', [1]) * len(jobs), array('q', tat), array('q', wt), array('q', rt), misses)
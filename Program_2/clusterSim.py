@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# clusterSim.py
+# Front-end dispatch across a fleet: a dispatcher routes each arriving job to one of K
+# nodes, then every node runs schedSim's engine for the chosen policy on the jobs it got.
+#
+# Routing happens first, in arrival order. Dispatchers that look at queue lengths see
+# what a front end can track on its own: the jobs it sent to a node that have not yet
+# finished, with finish times estimated from the node's backlog as if it served them in
+# order. That estimate is exact for FIFO nodes and the node's busy period is exact for
+# any policy. Once routed, the nodes are independent and are simulated in parallel.
+# Each node hands back quantile sketches of its jobs' metrics rather than the per-job
+# results, and the fleet's percentiles come from merging them.
+import sys
+import heapq
+import random
+from array import array
+from multiprocessing import Pool
+
+from schedSim import QUANTUM_POLICIES, REALTIME_POLICIES, TAIL_PERCENTILES, ScheduleType, SchedulerSimulator, metric_sketches
+from schedSketch import QuantileSketch
+
+PARALLEL_NODES = 8  # Simulate nodes in worker processes from this many nodes up
+METRICS = ('Turnaround', 'Wait', 'Response')
+
+class Dispatcher:
+    # route() picks the node for a job arriving now, given each node's outstanding jobs
+    def __init__(self, nodes, seed=0):
+        self.nodes = nodes
+        self.random = random.Random(seed)
+
+    def route(self, outstanding):
+        return 0
+
+class RandomDispatcher(Dispatcher):
+    def route(self, outstanding):
+        return self.random.randrange(self.nodes)
+
+class RoundRobinDispatcher(Dispatcher):
+    def __init__(self, nodes, seed=0):
+        super().__init__(nodes, seed)
+        self.next_node = 0
+
+    def route(self, outstanding):
+        node = self.next_node
+        self.next_node = (node + 1) % self.nodes
+        return node
+
+class ShortestQueueDispatcher(Dispatcher):
+    def route(self, outstanding):
+        return min(range(self.nodes), key=outstanding.__getitem__)
+
+class PowerOfTwoDispatcher(Dispatcher): # Sample two nodes, join the shorter queue
+    def route(self, outstanding):
+        if self.nodes == 1:
+            return 0
+        first, second = self.random.sample(range(self.nodes), 2)
+        return first if outstanding[first] <= outstanding[second] else second
+
+DISPATCHERS = {
+    'random': RandomDispatcher,
+    'rr': RoundRobinDispatcher,
+    'jsq': ShortestQueueDispatcher,
+    'po2': PowerOfTwoDispatcher,
+}
+
+def route_jobs(jobs, nodes, dispatcher):
+    outstanding = [0] * nodes  # Jobs routed to each node and not yet finished
+    busy_until = [0] * nodes  # When each node's current backlog drains
+    finishing = []  # heap of (estimated finish time, node)
+    placement = array('l', [0]) * len(jobs)
+
+    for i in range(len(jobs)):
+        now = jobs.arrival_time[i]
+        while finishing and finishing[0][0] <= now:
+            outstanding[heapq.heappop(finishing)[1]] -= 1
+
+        node = dispatcher.route(outstanding)
+        placement[i] = node
+        outstanding[node] += 1
+        busy_until[node] = max(busy_until[node], now, 0) + jobs.run_time[i]
+        heapq.heappush(finishing, (busy_until[node], node))
+    return placement
+
+def split_jobs(jobs, nodes, placement): # Per-node job columns, still sorted
+    fields = jobs.columns()
+    columns = [tuple(array('q') for _ in fields) for _ in range(nodes)]
+    for i, node in enumerate(placement):
+        for column, field in zip(columns[node], fields):
+            column.append(field[i])
+    return columns
+
+def simulate_node(task):
+    algorithm, quantum, columns = task
+    simulator = SchedulerSimulator(None, algorithm, quantum)
+    simulator.jobs.attach(*columns)
+    simulator.simulate()
+    return metric_sketches(*simulator.job_metrics())
+
+class ClusterSimulator:
+    def __init__(self, job_file, nodes, algorithm=ScheduleType.FIFO, quantum=1, workers=None, seed=0):
+        self.job_file = job_file
+        self.nodes = nodes
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.workers = workers
+        self.seed = seed
+        self.loader = SchedulerSimulator(job_file)
+        self.jobs = self.loader.jobs
+        self.results = {}  # dispatcher name -> (turnaround, wait, response) sketches over all jobs
+
+    def read_file(self):
+        self.loader.read_file()
+        self.loader.assign_job_ids()
+        self.jobs = self.loader.jobs
+
+    def simulate(self, dispatchers):
+        for name in dispatchers:
+            dispatcher = DISPATCHERS[name](self.nodes, self.seed)
+            placement = route_jobs(self.jobs, self.nodes, dispatcher)
+            tasks = [(self.algorithm, self.quantum, columns)
+                     for columns in split_jobs(self.jobs, self.nodes, placement) if columns[0]]
+            if self.nodes >= PARALLEL_NODES and self.workers != 1:
+                with Pool(self.workers) as pool:
+                    node_results = pool.map(simulate_node, tasks)
+            else:
+                node_results = [simulate_node(task) for task in tasks]
+
+            sketches = tuple(QuantileSketch() for _ in METRICS)
+            for node_sketches in node_results:
+                for sketch, node_sketch in zip(sketches, node_sketches):
+                    sketch.merge(node_sketch)
+            self.results[name] = sketches
+
+    def print_results(self):
+        quantum = f" q={self.quantum}" if self.algorithm in QUANTUM_POLICIES else ""
+        print(f"{len(self.jobs)} jobs on {self.nodes} nodes, local policy {self.algorithm.value}{quantum}")
+        print(f"{'Dispatcher':<12}{'Metric':<12}{'Mean':>10}"
+              + "".join(f"{f'p{100 * fraction:g}':>10}" for fraction in TAIL_PERCENTILES) + f"{'Max':>10}")
+        for name, sketches in self.results.items():
+            for metric, sketch in zip(METRICS, sketches):
+                tails = sketch.quantiles(TAIL_PERCENTILES)
+                print(f"{name if metric == METRICS[0] else '':<12}{metric:<12}{sketch.mean():>10.2f}"
+                      + "".join(f"{float(value):>10.2f}" for value in tails) + f"{float(sketch.maximum):>10.2f}")
+
+def parse_arguments():
+    if len(sys.argv) < 2:
+        print("Usage: clusterSim <job-file.txt|trace.bin> [-k <NODES>] [-d <DISPATCHER>,...] "
+              "[-p <ALGORITHM>] [-q <QUANTUM>] [-j <WORKERS>] [-s <SEED>]")
+        sys.exit(1)
+
+    options = {'job_file': sys.argv[1], 'nodes': 4, 'dispatchers': list(DISPATCHERS),
+               'algorithm': ScheduleType.FIFO, 'quantum': 1, 'workers': None, 'seed': 0}
+    i = 2
+    while i + 1 < len(sys.argv):
+        flag, value = sys.argv[i].lower(), sys.argv[i + 1]
+        try:
+            if flag == '-k' and int(value) > 0:
+                options['nodes'] = int(value)
+            elif flag == '-d':
+                options['dispatchers'] = [name for name in value.split(',') if name in DISPATCHERS] or options['dispatchers']
+            elif flag == '-p':
+                options['algorithm'] = ScheduleType(value)
+            elif flag == '-q' and int(value) > 0:
+                options['quantum'] = int(value)
+            elif flag == '-j' and int(value) > 0:
+                options['workers'] = int(value)
+            elif flag == '-s':
+                options['seed'] = int(value)
+        except ValueError:
+            pass
+        i += 2  # Next flag-value pair
+    return options
+
+def main():
+    options = parse_arguments()
+    if options['algorithm'] in REALTIME_POLICIES:
+        print(f"Error: {options['algorithm'].value} is not supported across nodes.")  # Results are per-task totals
+        sys.exit(1)
+    simulator = ClusterSimulator(options['job_file'], options['nodes'], options['algorithm'],
+                                 options['quantum'], options['workers'], options['seed'])
+    simulator.read_file()
+    if not len(simulator.jobs):
+        print(f"Error: No jobs in '{options['job_file']}'.")
+        sys.exit(1)
+    if simulator.jobs.bursts is not None:
+        print("Error: Jobs with I/O bursts are not supported across nodes.")
+        sys.exit(1)
+    simulator.simulate(options['dispatchers'])
+    simulator.print_results()
+
+if __name__ == "__main__":
+    main()
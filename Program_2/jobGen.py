@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# jobGen.py
+# Synthetic job files for schedSim. Every random draw is a hash of (seed, stream, job
+# index) rather than the next value of a generator, so any chunk of jobs can be made on
+# its own: numpy does a whole chunk per call, and a seed gives the same jobs with or
+# without numpy and at any chunk size. Chunks go to disk as they are made, as a text job
+# file or, for a .bin path, a binary trace.
+#
+#   arrivals:   poisson:<RATE>            jobs per time unit
+#               bursty:<RATE>,<BURST>     same rate, in batches of mean size BURST arriving together
+#   run times:  exp:<MEAN>
+#               pareto:<MEAN>,<SHAPE>     heavy tail, SHAPE > 1
+#               bimodal:<SHORT>,<LONG>,<FRACTION>   LONG for that fraction of jobs, else SHORT
+import sys
+import math
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from jobTrace import TRACE_COLUMNS, TraceError, TraceWriter
+
+CHUNK_JOBS = 1 << 20
+RUN_TIME_CAP = 1 << 40  # Pareto tails are cut here, far below int64 overflow
+MASK64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15  # splitmix64 constants
+MIX1 = 0xBF58476D1CE4E5B9
+MIX2 = 0x94D049BB133111EB
+ARRIVAL_GAP, ARRIVAL_BATCH, RUN_TIME, RUN_MODE = range(4)  # Independent random streams
+
+def mix64(z):
+    z = (z ^ (z >> 30)) * MIX1 & MASK64
+    z = (z ^ (z >> 27)) * MIX2 & MASK64
+    return z ^ (z >> 31)
+
+def uniforms(seed, stream, first, count): # Draws in [0, 1) for jobs first .. first + count - 1
+    key = mix64((seed * 8 + stream) & MASK64)
+    if np is None:
+        return [(mix64((key + i * GOLDEN) & MASK64) >> 11) * 2.0 ** -53 for i in range(first + 1, first + count + 1)]
+    z = np.arange(first + 1, first + count + 1, dtype=np.uint64) * np.uint64(GOLDEN) + np.uint64(key)
+    z ^= z >> np.uint64(30)
+    z *= np.uint64(MIX1)
+    z ^= z >> np.uint64(27)
+    z *= np.uint64(MIX2)
+    z ^= z >> np.uint64(31)
+    return (z >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+def exponential(u, mean): # Inverse CDF
+    if np is None:
+        return [-mean * math.log1p(-x) for x in u]
+    return -mean * np.log1p(-u)
+
+def whole_units(x): # Run times round up to whole time units, at least 1
+    if np is None:
+        return array('q', (min(max(math.ceil(v), 1), RUN_TIME_CAP) for v in x))
+    return np.clip(np.ceil(x), 1, RUN_TIME_CAP).astype(np.int64)
+
+class PoissonArrivals:
+    def __init__(self, rate):
+        self.rate = rate
+
+    def gaps(self, seed, first, count): # Time from each job to the next
+        return exponential(uniforms(seed, ARRIVAL_GAP, first, count), 1 / self.rate)
+
+class BurstyArrivals(PoissonArrivals): # Batches arrive as a Poisson process, jobs within one together
+    def __init__(self, rate, burst):
+        super().__init__(rate)
+        self.burst = burst
+
+    def gaps(self, seed, first, count):
+        gaps = exponential(uniforms(seed, ARRIVAL_GAP, first, count), self.burst / self.rate)
+        last = uniforms(seed, ARRIVAL_BATCH, first, count)  # Does the job close its batch?
+        if np is None:
+            return [gap if u * self.burst < 1 else 0.0 for gap, u in zip(gaps, last)]
+        return np.where(last * self.burst < 1, gaps, 0.0)
+
+class ExponentialRuns:
+    def __init__(self, mean):
+        self.mean = mean
+
+    def draw(self, seed, first, count):
+        return whole_units(exponential(uniforms(seed, RUN_TIME, first, count), self.mean))
+
+class ParetoRuns:
+    def __init__(self, mean, shape):
+        self.shape = shape
+        self.scale = mean * (shape - 1) / shape  # Smallest run time, for the requested mean
+
+    def draw(self, seed, first, count):
+        # scale * (1 - u) ** (-1 / shape), with the power taken through the exponential draw
+        x = exponential(uniforms(seed, RUN_TIME, first, count), 1 / self.shape)
+        if np is None:
+            return whole_units([self.scale * math.exp(v) for v in x])
+        return whole_units(self.scale * np.exp(x))
+
+class BimodalRuns:
+    def __init__(self, short, long, fraction):
+        self.short = int(short)
+        self.long = int(long)
+        self.fraction = fraction
+
+    def draw(self, seed, first, count):
+        u = uniforms(seed, RUN_MODE, first, count)
+        if np is None:
+            return array('q', (self.long if x < self.fraction else self.short for x in u))
+        return np.where(u < self.fraction, self.long, self.short).astype(np.int64)
+
+ARRIVALS = {
+    'poisson': (PoissonArrivals, 1),
+    'bursty': (BurstyArrivals, 2),
+}
+
+RUN_TIMES = {
+    'exp': (ExponentialRuns, 1),
+    'pareto': (ParetoRuns, 2),
+    'bimodal': (BimodalRuns, 3),
+}
+
+def parse_distribution(spec, choices): # "name:a,b" -> instance, None if malformed
+    name, _, values = spec.partition(':')
+    if name not in choices:
+        return None
+    kind, arity = choices[name]
+    try:
+        values = [float(value) for value in values.split(',')] if values else []
+    except ValueError:
+        return None
+    if len(values) != arity or any(value <= 0 for value in values):
+        return None
+    if kind is BurstyArrivals and values[1] < 1:
+        return None  # Batches hold at least one job
+    if kind is ParetoRuns and values[1] <= 1:
+        return None  # The mean is infinite
+    if kind is BimodalRuns and (values[2] > 1 or not values[0].is_integer() or not values[1].is_integer()):
+        return None  # Whole run times and a fraction
+    return kind(*values)
+
+def generate(count, arrivals, run_times, seed=0, chunk_jobs=CHUNK_JOBS):
+    # Yields (run_time, arrival_time) int64 chunks, arrivals starting at 0
+    clock = 0.0
+    for first in range(0, count, chunk_jobs):
+        size = min(chunk_jobs, count - first)
+        gaps = arrivals.gaps(seed, first, size)
+        if np is None:
+            times = list(accumulate(gaps, initial=clock))  # Same additions, in the same order, as np.cumsum
+            arrival = array('q', map(math.floor, times[:-1]))
+        else:
+            times = np.cumsum(np.concatenate(([clock], gaps)))
+            arrival = np.floor(times[:-1]).astype(np.int64)
+        clock = float(times[-1])
+        yield run_times.draw(seed, first, size), arrival
+
+def write_jobs(path, count, arrivals, run_times, seed=0):
+    chunks = generate(count, arrivals, run_times, seed)
+    if path.endswith('.bin'):
+        with TraceWriter(path, TRACE_COLUMNS, count) as writer:
+            for run_time, arrival in chunks:
+                writer.write(run_time, arrival)
+        return
+
+    with open(path, 'w') as file:
+        for run_time, arrival in chunks:
+            if np is None:
+                pairs = [value for pair in zip(run_time, arrival) for value in pair]
+            else:
+                pairs = np.column_stack((run_time, arrival)).ravel().tolist()
+            file.write("%d %d\n" * len(run_time) % tuple(pairs))
+
+def parse_arguments():
+    if len(sys.argv) < 2:
+        print("Usage: jobGen.py <job-file.txt|trace.bin> [-n <JOBS>] [-a poisson:<RATE>|bursty:<RATE>,<BURST>] "
+              "[-r exp:<MEAN>|pareto:<MEAN>,<SHAPE>|bimodal:<SHORT>,<LONG>,<FRACTION>] [-s <SEED>]")
+        sys.exit(1)
+
+    options = {'path': sys.argv[1], 'count': 1000, 'arrivals': PoissonArrivals(0.1),
+               'run_times': ExponentialRuns(8), 'seed': 0}
+    i = 2
+    while i + 1 < len(sys.argv):
+        flag, value = sys.argv[i].lower(), sys.argv[i + 1]
+        if flag == '-a':
+            options['arrivals'] = parse_distribution(value, ARRIVALS)
+            if options['arrivals'] is None:
+                print(f"Error: Invalid arrival process '{value}'.")
+                sys.exit(1)
+        elif flag == '-r':
+            options['run_times'] = parse_distribution(value, RUN_TIMES)
+            if options['run_times'] is None:
+                print(f"Error: Invalid run time distribution '{value}'.")
+                sys.exit(1)
+        else:
+            try:
+                if flag == '-n' and int(value) >= 0:
+                    options['count'] = int(value)
+                elif flag == '-s':
+                    options['seed'] = int(value)
+            except ValueError:
+                pass
+        i += 2  # Next flag-value pair
+    return options
+
+def main():
+    options = parse_arguments()
+    try:
+        write_jobs(options['path'], options['count'], options['arrivals'], options['run_times'], options['seed'])
+    except (OSError, TraceError) as e:
+        print(f"Error: {e}.")
+        sys.exit(1)
+    print(f"Wrote {options['count']} jobs to '{options['path']}'")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# jobTrace.py
+# Binary job traces for schedSim: a fixed header followed by one packed int64 column
+# per field, so a loader can map the file and hand the columns out without copying.
+#
+#   header:  magic (8s) | version (u32) | columns (u32) | job count (u64)
+#   body:    run_time[count] | arrival_time[count] [| nice | deadline | period]    (little-endian int64)
+import sys
+import mmap
+import shutil
+import struct
+import tempfile
+from array import array
+
+TRACE_MAGIC = b'SCHEDJOB'
+TRACE_VERSION = 1
+TRACE_HEADER = struct.Struct('<8sIIQ')
+TRACE_COLUMNS = 2  # run_time, arrival_time
+TRACE_FIELDS = ('run_time', 'arrival_time', 'nice', 'deadline', 'period')  # Column order; readers ignore any beyond these
+COPY_CHUNK = 1 << 20  # Bytes moved per copy when assembling a trace
+
+class TraceError(Exception):
+    pass
+
+def is_binary_trace(path):
+    try:
+        with open(path, 'rb') as file:
+            return file.read(len(TRACE_MAGIC)) == TRACE_MAGIC
+    except OSError:
+        return False  # Let the text reader report missing files
+
+def load_trace(path): # Returns the int64 columns mapped from the file, in TRACE_FIELDS order
+    with open(path, 'rb') as file:
+        header = file.read(TRACE_HEADER.size)
+        if len(header) < TRACE_HEADER.size:
+            raise TraceError(f"'{path}' is too short for a job trace header")
+        magic, version, columns, count = TRACE_HEADER.unpack(header)
+        if magic != TRACE_MAGIC or version != TRACE_VERSION:
+            raise TraceError(f"'{path}' is not a version {TRACE_VERSION} job trace")
+        if columns < TRACE_COLUMNS:
+            raise TraceError(f"'{path}' has {columns} columns, expected {TRACE_COLUMNS}")
+
+        size = TRACE_HEADER.size + columns * count * 8
+        columns = min(columns, len(TRACE_FIELDS))
+        if count == 0:
+            return tuple(array('q') for _ in range(columns))
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(data) < size:
+            data.close()
+            raise TraceError(f"'{path}' is truncated: header says {count} jobs")
+
+    # The views keep the mapping alive; the file descriptor is no longer needed
+    body = memoryview(data)[TRACE_HEADER.size:size].cast('q')
+    fields = tuple(body[column * count:(column + 1) * count] for column in range(columns))
+    if sys.byteorder != 'little':
+        fields = tuple(array('q', field) for field in fields)
+        for field in fields:
+            field.byteswap()
+    return fields
+
+class TraceWriter:
+    # Writes a trace from chunks of jobs without holding it in memory: run times go
+    # straight to the output while the other columns are spooled to scratch files and
+    # appended at close, when the job count for the header is finally known. Given the
+    # count up front, every column is written in place instead and nothing is spooled
+    def __init__(self, path, columns=TRACE_COLUMNS, count=None):
+        self.file = open(path, 'wb')
+        self.spools = [tempfile.TemporaryFile() for _ in range(columns - 1)] if count is None else []
+        self.columns = columns
+        self.count = 0
+        self.expected = count
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, columns, count or 0))
+
+    def write(self, run_time, *columns): # Any buffers of int64, e.g. array('q'), in TRACE_FIELDS order
+        if len(columns) != self.columns - 1:
+            raise TraceError(f"expected {self.columns} columns, got {len(columns) + 1}")
+        if any(len(column) != len(run_time) for column in columns):
+            raise TraceError("column chunks differ in length")
+        if self.expected is not None:
+            if self.count + len(run_time) > self.expected:
+                raise TraceError(f"more than the {self.expected} jobs the trace was opened for")
+            for field, column in enumerate((run_time,) + columns):
+                self.file.seek(TRACE_HEADER.size + (field * self.expected + self.count) * 8)
+                self.file.write(as_little_endian(column))
+        else:
+            self.file.write(as_little_endian(run_time))
+            for spool, column in zip(self.spools, columns):
+                spool.write(as_little_endian(column))
+        self.count += len(run_time)
+
+    def close(self):
+        for spool in self.spools:
+            spool.seek(0)
+            shutil.copyfileobj(spool, self.file, COPY_CHUNK)
+            spool.close()
+        self.file.seek(0)
+        self.file.write(TRACE_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, self.columns, self.count))
+        self.file.close()
+        if self.expected is not None and self.count != self.expected:
+            raise TraceError(f"wrote {self.count} of the {self.expected} jobs the trace was opened for")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+def as_little_endian(column):
+    if sys.byteorder == 'little':
+        return memoryview(column).cast('B')
+    column = array('q', column)
+    column.byteswap()
+    return column
+
+def convert_text_trace(text_path, trace_path, chunk_jobs=65536):
+    # Same line rules as schedSim's reader: "<run_time> <arrival_time> [<nice> [<deadline>
+    # [<period>]]]", other lines skipped. Optional columns are written up to the widest line
+    with open(text_path, 'r') as text:
+        columns = max((len(parts) for parts in map(str.split, text) if len(parts) <= len(TRACE_FIELDS)), default=2)
+        columns = max(columns, TRACE_COLUMNS)
+        text.seek(0)
+        with TraceWriter(trace_path, columns) as writer:
+            chunk = tuple(array('q') for _ in range(columns))
+            for line in text:
+                parts = line.split()
+                if TRACE_COLUMNS <= len(parts) <= len(TRACE_FIELDS):
+                    for column, value in zip(chunk, parts + ['0'] * (columns - len(parts))):
+                        column.append(int(value))
+                    if len(chunk[0]) == chunk_jobs:
+                        writer.write(*chunk)
+                        chunk = tuple(array('q') for _ in range(columns))
+            writer.write(*chunk)
+            return writer.count
+
+def main():
+    if len(sys.argv) != 3:
+        print("Usage: jobTrace.py <job-file.txt> <trace-file.bin>")
+        sys.exit(1)
+    try:
+        count = convert_text_trace(sys.argv[1], sys.argv[2])
+    except FileNotFoundError:
+        print(f"Error: File '{sys.argv[1]}' not found.")
+        sys.exit(1)
+    except ValueError:
+        print(f"Error: Invalid job format in file '{sys.argv[1]}'.")
+        sys.exit(1)
+    print(f"Wrote {count} jobs to '{sys.argv[2]}'")
+
+if __name__ == "__main__":
+    main()
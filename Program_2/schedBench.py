@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# schedBench.py
+# Scaling benchmarks for schedSim's FIFO, SRTN, RR and HRRN engines. Traces come from jobGen
+# (exponential run times, Poisson arrivals at a given load) and are kept between runs.
+# Each case runs in its own process so its peak RSS is its own. Results go to a JSON file
+# and, given a baseline from an earlier run, cases that got slower or bigger are flagged.
+# Wall times are compared after scaling by a calibration loop timed alongside each case,
+# so a machine that is busier or clocked lower than when the baseline was taken does not
+# read as a regression.
+import os
+import sys
+import json
+import time
+import platform
+import tempfile
+import resource
+import subprocess
+
+from jobGen import ExponentialRuns, PoissonArrivals, write_jobs
+from schedSim import ScheduleType, SchedulerSimulator, np
+
+BENCH_DIR = os.environ.get('SCHEDBENCH_DIR', os.path.join(tempfile.gettempdir(), 'schedBench'))  # Generated traces
+JOB_COUNTS = (1000, 10000, 100000, 1000000, 10000000)
+POLICIES = (ScheduleType.FIFO, ScheduleType.SRTN, ScheduleType.RR, ScheduleType.HRRN)
+QUANTA = (1, 4, 16)  # RR only
+LOADS = (0.5, 0.9, 1.5)  # Offered load: arrival rate times mean run time
+MEAN_RUN_TIME = 8
+TRACE_SEED = 1
+REPEATS = 5  # Each case reports its median run and the spread around it
+TOLERANCE = 0.25  # Slowdown or growth over the baseline that counts as a regression
+SPREAD_MARGIN = 2  # A slowdown must also exceed this many times the worse of the two spreads
+NOISE_FLOOR = 0.2  # Seconds; faster cases are too noisy to compare
+CALIBRATION_STEPS = 200000  # Size of the fixed loop timed next to each run to gauge machine speed
+
+def trace_path(jobs, load):
+    os.makedirs(BENCH_DIR, exist_ok=True)
+    path = os.path.join(BENCH_DIR, f"exp{MEAN_RUN_TIME}-load{load}-{jobs}-s{TRACE_SEED}.bin")
+    if not os.path.exists(path):
+        partial = f"{path}.{os.getpid()}.tmp"
+        write_jobs(partial, jobs, PoissonArrivals(load / MEAN_RUN_TIME), ExponentialRuns(MEAN_RUN_TIME), TRACE_SEED)
+        os.replace(partial, path)
+    return path
+
+def calibrate(): # Seconds for a fixed amount of plain interpreter work
+    start = time.perf_counter()
+    total = 0
+    for i in range(CALIBRATION_STEPS):
+        total += i * i & 7
+    return time.perf_counter() - start
+
+def run_case(path, algorithm, quantum, repeats): # In the child: time the engine alone
+    simulator = SchedulerSimulator(path, algorithm, quantum)
+    simulator.read_file()
+    simulator.assign_job_ids()
+    walls = []
+    calibrations = []
+    for _ in range(repeats):
+        calibrations.append(calibrate())
+        start = time.perf_counter()
+        simulator.simulate()
+        walls.append(time.perf_counter() - start)
+    walls.sort()
+    calibrations.sort()
+    wall = walls[len(walls) // 2]
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak //= 1024  # Bytes there, KiB elsewhere
+    # spread: how far the runs fell apart, relative to the median
+    return {'wall': wall, 'spread': (walls[-1] - walls[0]) / wall if wall else 0.0,
+            'calibration': calibrations[len(calibrations) // 2], 'rss_mb': peak / 1024}
+
+def case_key(case):
+    return (case['policy'], case['quantum'], case['jobs'], case['load'])
+
+def run_suite(job_counts, policies, quanta, loads, repeats=REPEATS):
+    cases = []
+    for jobs in job_counts:
+        for load in loads:
+            path = trace_path(jobs, load)
+            for algorithm in policies:
+                for quantum in (quanta if algorithm == ScheduleType.RR else (None,)):
+                    child = subprocess.run([sys.executable, os.path.abspath(__file__), '--case', path,
+                                            algorithm.value, str(quantum or 1), str(repeats)],
+                                           capture_output=True, text=True)
+                    if child.returncode:
+                        print(f"Error: {algorithm.value} on {jobs} jobs failed: {child.stderr.strip()}")
+                        sys.exit(1)
+                    case = {'policy': algorithm.value, 'quantum': quantum, 'jobs': jobs, 'load': load}
+                    case.update(json.loads(child.stdout))
+                    case['jobs_per_s'] = jobs / case['wall'] if case['wall'] else 0.0
+                    cases.append(case)
+                    print_case(case)
+    return cases
+
+def print_case(case, baseline=None):
+    quantum = '-' if case['quantum'] is None else case['quantum']
+    line = (f"{case['policy']:<6}{quantum:>4}{case['jobs']:>10}{case['load']:>6}"
+            f"{case['wall']:>10.3f}{case['jobs_per_s']:>13.0f}{case['rss_mb']:>9.1f}")
+    if baseline is not None:
+        line += f"{percent_change(scaled_wall(case, baseline), baseline['wall']):>+9.1f}%{percent_change(case['rss_mb'], baseline['rss_mb']):>+8.1f}%"
+    print(line, flush=True)
+
+def scaled_wall(case, baseline): # The case's wall time at the speed the baseline's machine ran at
+    if case.get('calibration') and baseline.get('calibration'):
+        return case['wall'] * baseline['calibration'] / case['calibration']
+    return case['wall']
+
+def percent_change(value, base):
+    return 100.0 * (value - base) / base if base else 0.0
+
+def compare(cases, baseline_cases): # Returns the regressed cases
+    base = {case_key(case): case for case in baseline_cases}
+    regressions = []
+    missing = 0
+    print(f"{'Policy':<6}{'Q':>4}{'Jobs':>10}{'Load':>6}{'Wall':>10}{'Jobs/s':>13}{'RSS MB':>9}{'Wall':>10}{'RSS':>9}")
+    for case in cases:
+        old = base.get(case_key(case))
+        if old is None:
+            missing += 1
+            continue
+        print_case(case, old)
+        allowed = max(TOLERANCE, SPREAD_MARGIN * max(case['spread'], old.get('spread', 0.0)))
+        slower = scaled_wall(case, old) > max(old['wall'], NOISE_FLOOR) * (1 + allowed)
+        bigger = case['rss_mb'] > old['rss_mb'] * (1 + TOLERANCE)
+        if slower or bigger:
+            regressions.append(case)
+    if missing:
+        print(f"{missing} of {len(cases)} cases are not in the baseline and were not compared")
+    return regressions
+
+def parse_list(value, kind): # None unless every item parses, and numbers are positive
+    try:
+        items = [kind(item) for item in value.split(',')]
+    except ValueError:
+        return None
+    if kind in (int, float) and min(items) <= 0:
+        return None
+    return items
+
+def parse_arguments():
+    options = {'jobs': list(JOB_COUNTS), 'policies': list(POLICIES), 'quanta': list(QUANTA),
+               'loads': list(LOADS), 'repeats': REPEATS, 'output': 'bench.json', 'baseline': None}
+    i = 1
+    while i + 1 < len(sys.argv):
+        flag, value = sys.argv[i].lower(), sys.argv[i + 1]
+        parsed = None
+        if flag == '-n':
+            parsed = parse_list(value, int)
+            options['jobs'] = parsed
+        elif flag == '-p':
+            parsed = parse_list(value.upper(), ScheduleType)
+            options['policies'] = parsed
+        elif flag == '-q':
+            parsed = parse_list(value, int)
+            options['quanta'] = parsed
+        elif flag == '-d':
+            parsed = parse_list(value, float)
+            options['loads'] = parsed
+        elif flag == '-r':
+            parsed = parse_list(value, int)
+            options['repeats'] = parsed and parsed[-1]
+        elif flag == '-o':
+            parsed = options['output'] = value
+        elif flag == '--baseline':
+            parsed = options['baseline'] = value
+        if not parsed:
+            print("Usage: schedBench.py [-n <JOBS>,...] [-p FIFO,SRTN,RR,HRRN] [-q <QUANTUM>,...] [-d <LOAD>,...] "
+                  "[-r <REPEATS>] [-o <RESULTS.json>] [--baseline <BASELINE.json>]")
+            sys.exit(1)
+        i += 2  # Next flag-value pair
+    return options
+
+def main():
+    if len(sys.argv) == 6 and sys.argv[1] == '--case':
+        print(json.dumps(run_case(sys.argv[2], ScheduleType(sys.argv[3]), int(sys.argv[4]), int(sys.argv[5]))))
+        return
+
+    options = parse_arguments()
+    baseline = None
+    if options['baseline'] is not None:  # Checked first, so a bad path does not waste a run
+        try:
+            with open(options['baseline']) as file:
+                baseline = json.load(file)['cases']
+        except FileNotFoundError:
+            print(f"Error: No baseline at '{options['baseline']}'; record one with -o, or copy '{options['output']}' there.")
+            sys.exit(1)
+        except (ValueError, KeyError):
+            print(f"Error: '{options['baseline']}' is not a schedBench results file.")
+            sys.exit(1)
+    print(f"{'Policy':<6}{'Q':>4}{'Jobs':>10}{'Load':>6}{'Wall':>10}{'Jobs/s':>13}{'RSS MB':>9}")
+    cases = run_suite(options['jobs'], options['policies'], options['quanta'], options['loads'], options['repeats'])
+    with open(options['output'], 'w') as file:
+        json.dump({'python': platform.python_version(), 'numpy': np is not None,
+                   'machine': platform.machine(), 'cases': cases}, file, indent=1)
+    print(f"Wrote {len(cases)} results to '{options['output']}'")
+
+    if baseline is None:
+        return
+    regressions = compare(cases, baseline)
+    if regressions:
+        print(f"{len(regressions)} of {len(cases)} cases regressed by more than {TOLERANCE:.0%}")
+        sys.exit(1)
+    print("No regressions")
+
+if __name__ == "__main__":
+    main()
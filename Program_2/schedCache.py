@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# schedCache.py
+# On-disk cache of per-job schedSim results. Entries are keyed by a hash of the job
+# file's contents plus the policy parameters, and the directory is kept under a size
+# budget by evicting the least recently used entries first.
+import os
+import struct
+import hashlib
+from array import array
+
+CACHE_DIR = os.environ.get('SCHEDSIM_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'schedSim'))
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_VERSION = 2  # Bump when an engine change alters results
+ENTRY_MAGIC = b'SCHEDRES'
+ENTRY_HEADER = struct.Struct('<8sQ')  # magic, job count
+ENTRY_COLUMNS = 3  # Turnaround, wait and response, one int64 per job each
+HASH_CHUNK = 1 << 20
+
+def file_digest(path):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResultCache:
+    def __init__(self, directory=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, job_file, parameters): # parameters: dict of everything that shapes the schedule
+        settings = ','.join(f"{name}={parameters[name]}" for name in sorted(parameters))
+        digest = hashlib.blake2b(f"v{CACHE_VERSION}|{file_digest(job_file)}|{settings}".encode(), digest_size=20)
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + '.res')
+
+    def load(self, key): # Returns (turnaround, wait, response) columns, or None on a miss
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as file:
+                magic, count = ENTRY_HEADER.unpack(file.read(ENTRY_HEADER.size))
+                if magic != ENTRY_MAGIC:
+                    raise ValueError
+                columns = tuple(array('q') for _ in range(ENTRY_COLUMNS))
+                for column in columns:
+                    column.fromfile(file, count)
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, struct.error):
+            self.discard(path)  # Unreadable entries are treated as misses
+            return None
+        return columns
+
+    def store(self, key, *columns):
+        if ENTRY_HEADER.size + sum(memoryview(column).nbytes for column in columns) > self.max_bytes:
+            return  # Could only be kept by evicting everything else, itself included
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(key)
+        partial = f"{path}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as file:
+            file.write(ENTRY_HEADER.pack(ENTRY_MAGIC, len(columns[0])))
+            for column in columns:
+                file.write(memoryview(column).cast('B'))
+        os.replace(partial, path)  # Readers never see half an entry
+        self.evict()
+
+    def evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.res'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.discard(path)
+            total -= size
+
+    def discard(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# schedCheckpoint.py
+# Snapshots of a running SRTN or RR simulation, so a long run can pick up where it was
+# stopped. The engines offer a snapshot at the top of their loop, where the whole state
+# is the clock, the arrival cursor, the per-job columns and the ready queue in order;
+# one is written when the interval has passed. Jobs past the cursor have not arrived, so
+# only the columns before it are stored. Each snapshot replaces the last atomically.
+#
+#   magic (8s) | version (u32) | reserved (u32) | run key (20s)
+#   clock | completed | cursor | switches | overhead | last job | engine counter | ready count  (int64)
+#   remaining, start and finish times of jobs before the cursor, then the ready queue  (int64)
+import os
+import sys
+import time
+import struct
+import hashlib
+from array import array
+
+from schedCache import file_digest
+
+CHECKPOINT_MAGIC = b'SCHEDCKP'
+CHECKPOINT_VERSION = 1
+CHECKPOINT_HEADER = struct.Struct('<8sII20s8q')
+CHECKPOINT_INTERVAL = 300  # Default seconds between snapshots
+CHECKPOINT_STEPS = 65536  # Engine steps between looks at the clock
+
+class CheckpointError(Exception):
+    pass
+
+def run_key(job_file, parameters): # Ties a snapshot to the job file's contents and the settings
+    settings = ','.join(f"{name}={parameters[name]}" for name in sorted(parameters))
+    return hashlib.blake2b(f"{file_digest(job_file)}|{settings}".encode(), digest_size=20).digest()
+
+def write_column(file, column):
+    if sys.byteorder != 'little':
+        column = array('q', column)
+        column.byteswap()
+    file.write(memoryview(column).cast('B'))
+
+def read_column(file, count, path):
+    column = array('q')
+    try:
+        column.fromfile(file, count)
+    except EOFError:
+        raise CheckpointError(f"Checkpoint '{path}' is truncated")
+    if sys.byteorder != 'little':
+        column.byteswap()
+    return column
+
+class Checkpointer:
+    def __init__(self, path, key, interval=CHECKPOINT_INTERVAL, resume=False):
+        self.path = path
+        self.key = key
+        self.interval = interval
+        self.resume = resume
+        self.steps = CHECKPOINT_STEPS
+        self.next_save = time.monotonic() + interval
+
+    def due(self): # Called once per engine step; only every CHECKPOINT_STEPS-th call reads the clock
+        self.steps -= 1
+        if self.steps:
+            return False
+        self.steps = CHECKPOINT_STEPS
+        return time.monotonic() >= self.next_save
+
+    def save(self, sim, ready, counter=0): # ready: job indices in queue (or heap) order
+        jobs = sim.jobs
+        cursor = sim.next_arrival
+        partial = f"{self.path}.{os.getpid()}.tmp"
+        with open(partial, 'wb') as file:
+            file.write(CHECKPOINT_HEADER.pack(
+                CHECKPOINT_MAGIC, CHECKPOINT_VERSION, 0, self.key, sim.current_time, sim.completed_jobs, cursor,
+                sim.switches, sim.overhead, -1 if sim.last_job is None else sim.last_job, counter, len(ready)))
+            for column in (jobs.remaining_time, jobs.start_time, jobs.finish_time):
+                write_column(file, column[:cursor])
+            write_column(file, array('q', ready))
+            file.flush()
+            os.fsync(file.fileno())  # On disk before it replaces the last good snapshot
+        os.replace(partial, self.path)
+        self.next_save = time.monotonic() + self.interval
+
+    def restore(self, sim): # Loads the snapshot into sim; returns (ready, counter), or None to start afresh
+        if not self.resume or not os.path.exists(self.path):
+            return None
+        jobs = sim.jobs
+        with open(self.path, 'rb') as file:
+            header = file.read(CHECKPOINT_HEADER.size)
+            if len(header) < CHECKPOINT_HEADER.size:
+                raise CheckpointError(f"Checkpoint '{self.path}' is too short for a header")
+            (magic, version, _, key, clock, completed, cursor, switches, overhead, last_job, counter,
+             ready_count) = CHECKPOINT_HEADER.unpack(header)
+            if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+                raise CheckpointError(f"'{self.path}' is not a version {CHECKPOINT_VERSION} checkpoint")
+            if key != self.key or cursor > len(jobs):
+                raise CheckpointError(f"Checkpoint '{self.path}' is from another job file or other settings")
+            for name in ('remaining_time', 'start_time', 'finish_time'):
+                getattr(jobs, name)[:cursor] = read_column(file, cursor, self.path)
+            ready = read_column(file, ready_count, self.path)
+        sim.current_time = clock
+        sim.completed_jobs = completed
+        sim.next_arrival = cursor
+        sim.switches = switches
+        sim.overhead = overhead
+        sim.last_job = None if last_job == -1 else last_job
+        return ready, counter
+
+    def finish(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -1,13 +1,105 @@
 #!/usr/bin/env python3
+import os
 import sys
+import math
+import heapq
+import random
+import tempfile
+from array import array
+from collections import deque
 from enum import Enum
+from itertools import islice
+from multiprocessing import Pool
+from operator import le, sub, truediv
+
+from jobTrace import TraceError, TraceWriter, is_binary_trace, load_trace
+from schedCache import ResultCache
+from schedSketch import QuantileSketch
+
+try:
+    import numpy as np  # Optional: vectorized FIFO and result aggregation
+except ImportError:
+    np = None
+
+RESULT_CHUNK = 65536  # Result lines formatted per write
+TAIL_PERCENTILES = (0.50, 0.90, 0.99, 0.999)  # Reported for turnaround, wait and response
+STREAM_REORDER_LIMIT = 65536  # Results --stream holds out of order before spilling a sorted run to disk
+STREAM_SPILL_READ = 1024  # Results read back from a spilled run at a time
+STREAM_REPORT_INTERVAL = 100000  # Completions between the running averages --stream writes
+
+def column_total(column):
+    if np is not None and isinstance(column, np.ndarray):
+        return int(column.sum())
+    return sum(column)
 
 class ScheduleType(Enum):
     FIFO = "FIFO"  # First In First Out
     SRTN = "SRTN"  # Shortest Remaining Time Next
     RR = "RR"      # Round Robin
+    MLFQ = "MLFQ"  # Multi-Level Feedback Queue
+    CFS = "CFS"    # Completely Fair Scheduler
+    LOTTERY = "LOTTERY"  # Lottery scheduling
+    STRIDE = "STRIDE"    # Stride scheduling
+    EDF = "EDF"    # Earliest Deadline First
+    RM = "RM"      # Rate Monotonic
+    SJF = "SJF"    # Shortest Job First
+    HRRN = "HRRN"  # Highest Response Ratio Next
+    PRIORITY = "PRIORITY"  # Static priority with aging
+
+QUANTUM_POLICIES = {ScheduleType.RR, ScheduleType.MLFQ, ScheduleType.LOTTERY, ScheduleType.STRIDE}  # Policies whose results depend on -q
+STREAM_POLICIES = {ScheduleType.FIFO, ScheduleType.SRTN, ScheduleType.RR}  # Policies --stream can replay
+OPTIONAL_FIELDS = ('nice', 'deadline', 'period')  # Job-file columns after run and arrival time
+FAIR_SHARE_POLICIES = {ScheduleType.CFS, ScheduleType.LOTTERY, ScheduleType.STRIDE}  # Policies that also report fairness
+REALTIME_POLICIES = {ScheduleType.EDF, ScheduleType.RM}  # Policies that run periodic tasks and count misses
+RANKED_POLICIES = {ScheduleType.SJF, ScheduleType.HRRN, ScheduleType.PRIORITY}  # Non-preemptive, also report starvation
+ENGINES = {  # SchedulerSimulator method that runs each policy; burstSim's EventEngine runs them all
+    ScheduleType.FIFO: 'fifo',
+    ScheduleType.SRTN: 'srtn',
+    ScheduleType.RR: 'rr',
+    ScheduleType.MLFQ: 'mlfq',
+    ScheduleType.CFS: 'cfs',
+    ScheduleType.LOTTERY: 'lottery',
+    ScheduleType.STRIDE: 'stride',
+    ScheduleType.EDF: 'realtime',
+    ScheduleType.RM: 'realtime',
+    ScheduleType.SJF: 'ranked',
+    ScheduleType.HRRN: 'ranked',
+    ScheduleType.PRIORITY: 'ranked',
+}
+REALTIME_PERIODS = 100  # Default horizon cap, in multiples of the longest period, for huge hyperperiods
+MLFQ_LEVELS = 3  # Default level count; level k gets a quantum of q * 2**k
+CFS_LATENCY = 8  # Period in which every runnable job should get a slice
+CFS_GRANULARITY = 1  # Shortest slice; the period stretches once jobs * granularity exceeds it
+NICE_0_WEIGHT = 1024
+VRUNTIME_SCALE = NICE_0_WEIGHT << 20  # Fixed-point vruntime units per unit of time at nice 0
+STRIDE1 = 1 << 30  # Stride of a job holding one ticket; tickets come from the nice weights
+AGING_INTERVAL = 10  # Waiting time that moves a PRIORITY job up one step, 0 never
+PRIORITY_TOP = -20  # Aging stops at the highest nice value; priorities come from the nice column
+
+# Linux's nice-to-weight table: each nice step is about a 10% CPU share difference
+NICE_WEIGHTS = (
+    88761, 71755, 56483, 46273, 36291,  # -20
+    29154, 23254, 18705, 14949, 11916,  # -15
+    9548, 7620, 6100, 4904, 3906,       # -10
+    3121, 2501, 1991, 1586, 1277,       # -5
+    1024, 820, 655, 526, 423,           # 0
+    335, 272, 215, 172, 137,            # 5
+    110, 87, 70, 56, 45,                # 10
+    36, 29, 23, 18, 15,                 # 15
+)
+
+def nice_weight(nice):
+    return NICE_WEIGHTS[min(max(nice, -20), 19) + 20]
+
+def parse_bursts(text): # "5,3,2": CPU 5, I/O 3, CPU 2. Starts and ends on a CPU burst
+    bursts = tuple(int(burst) for burst in text.split(','))
+    if len(bursts) % 2 == 0 or min(bursts) < 0 or bursts[-1] == 0:
+        raise ValueError(f"bad burst list '{text}'")
+    return bursts
 
 class Job:
+    __slots__ = ('id', 'run_time', 'arrival_time', 'remaining_time', 'start_time', 'finish_time')
+
     def __init__(self, run_time, arrival_time):
         self.id = None  # Will be assigned based on arrival order
         self.run_time = run_time
@@ -16,23 +108,383 @@ class Job:
         self.start_time = -1  # Time when job first starts running
         self.finish_time = -1  # Time when job completes
 
+class JobTable:
+    # Column-wise job storage: job i is row i of each typed array (8 bytes per field),
+    # and once sorted by arrival its row number is also its job ID
+    def __init__(self):
+        self.run_time = array('q')
+        self.arrival_time = array('q')
+        self.remaining_time = array('q')
+        self.start_time = array('q')  # Time when job first starts running
+        self.finish_time = array('q')  # Time when job completes
+        self.nice = None  # Optional columns stay None while every job has 0 there
+        self.deadline = None  # Relative to each release; periodic tasks default to their period
+        self.period = None  # Periodic tasks release a new instance every period
+        self.extended = False  # Any optional column present
+        self.bursts = None  # Per job: None for one CPU burst, else (CPU, I/O, ..., CPU) times
+        self.io_time = None  # Total I/O time per job, alongside bursts
+
+    def __len__(self):
+        return len(self.run_time)
+
+    def append(self, run_time, arrival_time, *optional, bursts=None): # optional: nice, deadline, period
+        if optional or self.extended:
+            self.append_optional(optional)
+        if bursts is not None or self.bursts is not None:
+            self.append_bursts(bursts)
+        self.run_time.append(run_time)
+        self.arrival_time.append(arrival_time)
+        self.remaining_time.append(run_time)
+        self.start_time.append(-1)
+        self.finish_time.append(-1)
+
+    def append_optional(self, optional):
+        for field, value in zip(OPTIONAL_FIELDS, optional + (0,) * len(OPTIONAL_FIELDS)):
+            column = getattr(self, field)
+            if column is None and value:
+                column = array('q', [0]) * len(self)  # First non-zero value: back-fill the rest
+                setattr(self, field, column)
+                self.extended = True
+            if column is not None:
+                column.append(value)
+
+    def append_bursts(self, bursts):
+        if self.bursts is None:
+            self.bursts = [None] * len(self)  # First multi-burst job: back-fill the rest
+            self.io_time = array('q', [0]) * len(self)
+        self.bursts.append(bursts)
+        self.io_time.append(sum(bursts[1::2]) if bursts else 0)
+
+    def sort_by_arrival(self): # Stable, so jobs arriving together keep their file order
+        fields = ('run_time',) + tuple(field for field in OPTIONAL_FIELDS + ('io_time',)
+                                       if getattr(self, field) is not None)
+        order = None
+        if np is not None:
+            arrival = np.frombuffer(self.arrival_time, dtype=np.int64)
+            if not np.all(arrival[1:] >= arrival[:-1]):
+                order = np.argsort(arrival, kind='stable')
+                for field in fields:
+                    setattr(self, field, array('q', np.frombuffer(getattr(self, field), dtype=np.int64)[order].tobytes()))
+                self.arrival_time = array('q', arrival[order].tobytes())
+                order = order.tolist()
+        elif not all(map(le, self.arrival_time, islice(self.arrival_time, 1, None))):
+            order = sorted(range(len(self)), key=self.arrival_time.__getitem__)
+            for field in fields + ('arrival_time',):
+                column = getattr(self, field)
+                setattr(self, field, array('q', [column[i] for i in order]))
+        if order is not None and self.bursts is not None:
+            self.bursts = [self.bursts[i] for i in order]
+        self.reset()
+
+    def attach(self, run_time, arrival_time, *optional): # Adopts columns as-is, e.g. views of a mapped trace
+        # The per-run columns are left empty until reset(), which simulate() always calls
+        self.run_time = run_time
+        self.arrival_time = arrival_time
+        optional += (None,) * len(OPTIONAL_FIELDS)
+        for field, column in zip(OPTIONAL_FIELDS, optional):
+            setattr(self, field, column)
+        self.extended = any(column is not None for column in optional)
+
+    def columns(self): # The input columns, in trace order, up to the last one present
+        columns = [self.run_time, self.arrival_time] + [getattr(self, field) for field in OPTIONAL_FIELDS]
+        while columns[-1] is None:
+            columns.pop()
+        return tuple(array('q', [0]) * len(self) if column is None else column for column in columns)
+
+    def reset(self):
+        self.remaining_time = array('q')
+        self.remaining_time.frombytes(memoryview(self.run_time).cast('B'))
+        self.start_time = array('q', [-1]) * len(self)
+        self.finish_time = array('q', [-1]) * len(self)
+
+class TicketTree:
+    # Fenwick tree over job indices holding each ready job's tickets, so adding or
+    # removing a job and finding the holder of a drawn ticket are both O(log n)
+    def __init__(self, size):
+        self.capacity = 1 << size.bit_length()  # Power of two above size, so probes need no bounds check
+        self.tree = array('q', [0]) * self.capacity
+        self.total = 0
+
+    def add(self, index, tickets):
+        self.total += tickets
+        tree = self.tree
+        index += 1
+        while index < self.capacity:
+            tree[index] += tickets
+            index += index & -index
+
+    def holder(self, ticket): # Job index owning ticket number 0 <= ticket < total
+        tree = self.tree
+        position = 0
+        step = self.capacity >> 1
+        while step:
+            if tree[position + step] <= ticket:
+                position += step
+                ticket -= tree[position]
+            step >>= 1
+        return position
+
+class ReadyHeap:
+    # Binary heap of job indices that remembers where each job sits, so a job whose rank
+    # changes while it waits is sifted in O(log n) instead of re-sorting the queue.
+    # Jobs with the smaller key run first, ties go to the earlier arrival
+    def __init__(self, size, key):
+        self.heap = []
+        self.slot = array('q', [-1]) * size  # Position of each job in the heap, -1 when not ready
+        self.key = key
+
+    def __len__(self):
+        return len(self.heap)
+
+    def before(self, a, b):
+        key = self.key
+        return key[a] < key[b] or key[a] == key[b] and a < b
+
+    def place(self, position, job):
+        self.heap[position] = job
+        self.slot[job] = position
+
+    def push(self, job, since): # since: when the job became ready
+        self.heap.append(job)
+        self.sift_up(job)
+
+    def pop(self):
+        heap = self.heap
+        job = heap[0]
+        last = heap.pop()
+        self.slot[job] = -1
+        if heap:
+            self.place(0, last)
+            self.sift_down(0)
+        return job
+
+    def advance(self, now): # Brings ranks that change with time up to now
+        pass
+
+    def sift_up(self, job):
+        heap = self.heap
+        position = len(heap) - 1 if self.slot[job] == -1 else self.slot[job]
+        while position:
+            parent = (position - 1) >> 1
+            if not self.before(job, heap[parent]):
+                break
+            self.place(position, heap[parent])
+            position = parent
+        self.place(position, job)
+
+    def sift_down(self, position):
+        heap = self.heap
+        job = heap[position]
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and self.before(heap[child + 1], heap[child]):
+                child += 1
+            if not self.before(heap[child], job):
+                break
+            self.place(position, heap[child])
+            position = child
+        self.place(position, job)
+
+class AgingHeap(ReadyHeap):
+    # Static priority from the nice column. Every interval a job waits it moves up one
+    # step until PRIORITY_TOP, each step a decrease-key driven by a heap of due times
+    def __init__(self, size, priority, interval):
+        super().__init__(size, array('q', priority))
+        self.priority = priority
+        self.interval = interval
+        self.due = array('q', [0]) * size  # Next aging step of each ready job
+        self.steps = []  # heap of (due time, job), stale once the job has left or requeued
+
+    def push(self, job, since):
+        self.key[job] = self.priority[job]
+        super().push(job, since)
+        self.schedule(job, since)
+
+    def schedule(self, job, since):
+        if self.interval and self.key[job] > PRIORITY_TOP:
+            self.due[job] = since + self.interval
+            heapq.heappush(self.steps, (since + self.interval, job))
+
+    def advance(self, now):
+        steps = self.steps
+        while steps and steps[0][0] <= now:
+            due, job = heapq.heappop(steps)
+            if self.slot[job] != -1 and self.due[job] == due:
+                self.key[job] -= 1
+                self.sift_up(job)
+                self.schedule(job, due)
+
+class ResponseRatioHeap(ReadyHeap):
+    # HRRN ranks by (wait + length) / length, which changes as time passes, so this is a
+    # kinetic heap: every parent/child pair has a certificate, the first time the child
+    # outranks its parent, and advance() swaps pairs whose certificates have come due.
+    # Jobs of the same length never change places, so only the longest-waiting job of
+    # each length is in the kinetic heap and the rest queue behind it. The heap is as big
+    # as the number of distinct lengths waiting rather than the number of jobs, which
+    # keeps the swaps per job from growing with the backlog
+    def __init__(self, size, length):
+        super().__init__(size, length)
+        self.since = array('q', [0]) * size
+        self.length = array('q', [0]) * size  # Jobs of length 0 rank as length 1
+        self.now = 0
+        self.certificates = []  # heap of (time, position, child), checked again when due
+        self.moved = set()  # Positions filled since certificates were last issued
+        self.heads = {}  # Length -> the job of that length in the kinetic heap
+        self.queues = {}  # Length -> heap of (since, job) of the others, in the order they rank
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def before(self, a, b): # Ratios compared without division
+        now, since, length = self.now, self.since, self.length
+        ratio_a = (now - since[a] + length[a]) * length[b]
+        ratio_b = (now - since[b] + length[b]) * length[a]
+        return ratio_a > ratio_b or ratio_a == ratio_b and a < b
+
+    def place(self, position, job):
+        self.heap[position] = job
+        self.slot[job] = position
+        self.moved.add(position)
+
+    def certify(self): # New certificates for every pair that has a moved job at either end
+        heap, since, length, now = self.heap, self.since, self.length, self.now
+        size = len(heap)
+        pairs = set()
+        for position in self.moved:
+            pairs.update((position, 2 * position + 1, 2 * position + 2))
+        self.moved.clear()
+        for position in pairs:
+            if not 0 < position < size:
+                continue
+            child, parent = heap[position], heap[(position - 1) >> 1]
+            # Child minus parent ratio, scaled: slope * time + offset
+            slope = length[parent] - length[child]
+            offset = (length[child] - since[child]) * length[parent] - (length[parent] - since[parent]) * length[child]
+            if slope <= 0:
+                lead = slope * now + offset
+                if lead < 0 or lead == 0 and child > parent:
+                    continue  # Falls further behind, or keeps its distance
+                due = now  # Already ahead after a swap made later than it was due
+            elif child < parent:
+                due = -(offset // slope)  # Ties go to the child
+            else:
+                due = -offset // slope + 1
+            heapq.heappush(self.certificates, (max(due, now), position, child))
+
+    def push(self, job, since):
+        self.since[job] = since
+        length = self.length[job] = max(self.key[job], 1)
+        self.count += 1
+        head = self.heads.get(length)
+        if head is None:
+            self.heads[length] = job
+            self.queues[length] = []
+            super().push(job, since)
+        elif (since, job) < (self.since[head], head):  # Outranks the head from now on
+            self.heads[length] = job
+            heapq.heappush(self.queues[length], (self.since[head], head))
+            self.place(self.slot[head], job)
+            self.slot[head] = -1
+            self.sift_up(job)
+        else:
+            heapq.heappush(self.queues[length], (since, job))
+        self.certify()
+
+    def pop(self):
+        job = self.heap[0]
+        length = self.length[job]
+        queue = self.queues[length]
+        self.count -= 1
+        if queue:
+            _, head = heapq.heappop(queue)  # Next of the same length, never ahead of the old head
+            self.heads[length] = head
+            self.slot[job] = -1
+            self.place(0, head)
+            self.sift_down(0)
+        else:
+            del self.heads[length], self.queues[length]
+            super().pop()
+        self.certify()
+        return job
+
+    def advance(self, now):
+        self.now = now
+        heap, certificates = self.heap, self.certificates
+        while certificates and certificates[0][0] <= now:
+            _, position, child = heapq.heappop(certificates)
+            if position < len(heap) and heap[position] == child:
+                parent = (position - 1) >> 1
+                if self.before(child, heap[parent]):
+                    self.place(position, heap[parent])
+                    self.place(parent, child)
+                    self.certify()
+        if len(certificates) > 4 * len(heap) + 64:
+            certificates.clear()  # Drop stale certificates
+            self.moved.update(range(len(heap)))
+            self.certify()
+
 class SchedulerSimulator:
-    def __init__(self, job_file, algorithm=ScheduleType.FIFO, quantum=1):
+    def __init__(self, job_file, algorithm=ScheduleType.FIFO, quantum=1, fast_forward=True,
+                 levels=MLFQ_LEVELS, level_quanta=None, boost=0, allotment=1,
+                 latency=CFS_LATENCY, granularity=CFS_GRANULARITY, seed=0, horizon=None, events=False,
+                 switch_cost=0, warmup=0, aging=AGING_INTERVAL, timeline=None,
+                 policy=None, observer=None):
         self.job_file = job_file
         self.algorithm = algorithm
         self.quantum = quantum
-        self.jobs = []
+        self.fast_forward = fast_forward  # RR skips whole rotations when nothing can change
+        self.level_quanta = list(level_quanta or (quantum << level for level in range(levels)))
+        self.boost = boost  # MLFQ moves every job back to the top level this often, 0 never
+        self.allotment = allotment  # Quanta a job may use at an MLFQ level before it moves down
+        self.latency = latency
+        self.granularity = granularity
+        self.seed = seed  # Lottery draws are reproducible for a given seed
+        self.horizon = horizon  # Periodic tasks release no instances from here on
+        self.realtime_results = None  # EDF and RM: per-task (instances, turnaround, wait, response, misses) totals
+        self.sketches = None  # (turnaround, wait, response) QuantileSketches, when filled as the run goes
+        self.events = events  # Use the event-driven engine even when no job does I/O
+        self.switch_cost = switch_cost  # CPU time lost whenever a different job is dispatched
+        self.warmup = warmup  # Extra switch time for a job resuming with a cold cache
+        self.costs = bool(switch_cost or warmup)
+        self.timeline = timeline  # schedTimeline.TimelineRecorder that sees every slice, or None
+        self.every_slice = self.costs or timeline is not None  # Closed forms that skip run() are off
+        self.checkpoint = None  # schedCheckpoint.Checkpointer that SRTN and RR offer snapshots to
+        self.policy = policy  # burstSim.ReadyPolicy subclass to run instead of the algorithm's own
+        self.observer = observer  # burstSim.Observer; policies and observers run on the event engine
+        self.resumed = None  # (ready queue, engine counter) restored from a snapshot
+        self.switches = 0
+        self.overhead = 0
+        self.last_job = None  # Job whose state the CPU holds
+        self.aging = aging
+        self.jobs = JobTable()
         self.current_time = 0
         self.completed_jobs = 0
-        self.ready_queue = []
+        self.ready_queue = deque()
+        self.next_arrival = 0  # Arrival cursor into the arrival-sorted job list
         
     def read_file(self):
+        if is_binary_trace(self.job_file):
+            try:
+                self.jobs.attach(*load_trace(self.job_file))
+            except TraceError as e:
+                print(f"Error: {e}.")
+                sys.exit(1)
+            return
+
         try:
             with open(self.job_file, 'r') as file:
                 for line in file:
                     parts = line.strip().split()
-                    if len(parts) == 2:
-                        self.jobs.append(Job(int(parts[0]), int(parts[1]))) #order Burst-Time, Arrival Time
+                    if 2 <= len(parts) <= 5:
+                        if ',' in parts[0]:  # CPU and I/O bursts
+                            bursts = parse_bursts(parts[0])
+                            self.jobs.append(sum(bursts[0::2]), *map(int, parts[1:]), bursts=bursts)
+                        else:
+                            self.jobs.append(*map(int, parts)) #order Burst-Time, Arrival Time, optional Nice, Deadline, Period
         except FileNotFoundError:
             print(f"Error: File '{self.job_file}' not found.")
             sys.exit(1)
@@ -41,136 +493,541 @@ class SchedulerSimulator:
             sys.exit(1)
 
     def assign_job_ids(self):
-        self.jobs.sort(key=lambda job: job.arrival_time)
-        # Assign IDs based on sorted order
-        for i, job in enumerate(self.jobs):
-            job.id = i
+        # IDs are row numbers in arrival order
+        self.jobs.sort_by_arrival()
 
     def simulate(self):
         if not self.jobs:
             return
         
-        for job in self.jobs:
-            job.remaining_time = job.run_time
-            job.start_time = -1
-            job.finish_time = -1            
+        self.jobs.reset()
         self.current_time = 0
         self.completed_jobs = 0
-        self.ready_queue = []
-            
-        if self.algorithm == ScheduleType.FIFO:
-            self.fifo()
-        elif self.algorithm == ScheduleType.SRTN:
-            self.srtn()
-        elif self.algorithm == ScheduleType.RR:
-            self.rr()
+        self.ready_queue = deque()
+        self.next_arrival = 0
+        self.realtime_results = None
+        self.sketches = None
+        self.switches = 0
+        self.overhead = 0
+        self.last_job = None
+        self.resumed = self.checkpoint.restore(self) if self.checkpoint is not None else None
+
+        if self.timeline is not None:
+            self.run = self.recorded_run  # run() itself stays as cheap as it was
+        if self.jobs.bursts is not None or self.events or self.policy is not None or self.observer is not None:
+            self.simulate_events()
         else:
-            self.fifo()
+            getattr(self, ENGINES.get(self.algorithm, 'fifo'))()
     
+    def simulate_events(self):
+        from burstSim import EventEngine
+        if self.algorithm in REALTIME_POLICIES and self.jobs.period is not None and any(self.jobs.period):
+            print("Error: Periodic tasks are not supported with I/O bursts or --events.")
+            sys.exit(1)
+        EventEngine(self).run()
+
     def run(self, job_index, run_time):
-        job = self.jobs[job_index]
+        jobs = self.jobs
         
-        if job.start_time == -1:
-            job.start_time = self.current_time
+        if self.costs and job_index != self.last_job:
+            self.switch_to(job_index)
+        if jobs.start_time[job_index] == -1:
+            jobs.start_time[job_index] = self.current_time
         
-        old_time = self.current_time
         self.current_time += run_time
-        job.remaining_time -= run_time
+        jobs.remaining_time[job_index] -= run_time
         
-        if job.remaining_time == 0: # job completed?
-            job.finish_time = self.current_time
+        if jobs.remaining_time[job_index] == 0: # job completed?
+            jobs.finish_time[job_index] = self.current_time
             self.completed_jobs += 1
             return True  
         return False  
        
+    def recorded_run(self, job_index, run_time):
+        completed = type(self).run(self, job_index, run_time)
+        self.timeline.record(job_index, self.current_time - run_time, run_time)
+        return completed
+
+    def switch_to(self, job_index): # The slice starts once the CPU has loaded the job
+        overhead = self.switch_cost
+        if self.jobs.start_time[job_index] != -1:
+            overhead += self.warmup  # Other jobs ran since it last had the CPU
+        self.current_time += overhead
+        self.overhead += overhead
+        self.switches += 1
+        self.last_job = job_index
+
     def fifo(self):
+        if np is not None and not self.every_slice:
+            self.fifo_vectorized()
+            return
 
-        for job in self.jobs:
-            if self.current_time < job.arrival_time:
-                self.current_time = job.arrival_time
+        jobs = self.jobs
 
-            job.start_time = self.current_time
-            job.finish_time = self.current_time + job.run_time
-            job.remaining_time = 0  # No time left after finishing
+        for i in range(len(jobs)):
+            if self.current_time < jobs.arrival_time[i]:
+                self.current_time = jobs.arrival_time[i]
 
-            self.current_time = job.finish_time
+            if self.every_slice:
+                self.run(i, jobs.run_time[i])
+                continue
+            jobs.start_time[i] = self.current_time
+            jobs.finish_time[i] = self.current_time + jobs.run_time[i]
+            jobs.remaining_time[i] = 0  # No time left after finishing
+
+            self.current_time = jobs.finish_time[i]
 
             self.completed_jobs += 1
+
+    def fifo_vectorized(self):
+        # finish[i] = max(finish[i-1], arrival[i]) + run[i] unrolls to
+        # ends[i] + max(0, max over j <= i of (arrival[j] - ends[j-1])), ends = prefix sum of run
+        jobs = self.jobs
+        run = np.frombuffer(jobs.run_time, dtype=np.int64)
+        arrival = np.frombuffer(jobs.arrival_time, dtype=np.int64)
+        ends = np.cumsum(run)
+        finish = ends + np.maximum(np.maximum.accumulate(arrival - (ends - run)), 0)
+        self.store_schedule(finish - run, finish)
+
+    def srtn_same_arrival(self):
+        # Everyone is ready at once, so nothing is ever preempted: shortest first, one prefix sum
+        jobs = self.jobs
+        self.current_time = max(self.current_time, jobs.arrival_time[0])
+        if np is not None:
+            run = np.frombuffer(jobs.run_time, dtype=np.int64)
+            order = np.argsort(run, kind='stable')
+            finish = np.empty_like(run)
+            finish[order] = self.current_time + np.cumsum(run[order])
+            self.store_schedule(finish - run, finish)
+            return
+
+        order = sorted(range(len(jobs)), key=jobs.run_time.__getitem__)
+        for i in order:
+            jobs.start_time[i] = self.current_time
+            self.current_time += jobs.run_time[i]
+            jobs.finish_time[i] = self.current_time
+            jobs.remaining_time[i] = 0
+        self.completed_jobs = len(jobs)
+
+    def store_schedule(self, start, finish): # Copies NumPy results back into the job columns
+        jobs = self.jobs
+        jobs.start_time = array('q', start.tobytes())
+        jobs.finish_time = array('q', finish.tobytes())
+        jobs.remaining_time = array('q', [0]) * len(jobs)
+        self.current_time = int(finish.max())
+        self.completed_jobs = len(jobs)
     
-    def srtn(self):        
+    def srtn(self):
+        if self.jobs.arrival_time[0] == self.jobs.arrival_time[-1] and not self.every_slice:
+            self.srtn_same_arrival()
+            return
+
+        ready = [] # heap of (remaining_time, job_index), ties go to the earlier arrival
+        if self.resumed is not None:
+            ready = [(self.jobs.remaining_time[i], i) for i in self.resumed[0]]  # Keys are the remaining times
+        checkpoint = self.checkpoint
+
         while self.completed_jobs < len(self.jobs):
-            available_jobs = self.available_jobs() # Manually sort by shortest remaining time, 
-            
-            if not available_jobs:
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save(self, [i for _, i in ready])
+            for i in self.admit_arrivals():
+                heapq.heappush(ready, (self.jobs.remaining_time[i], i))
+
+            if not ready:
                 if not self.advance_to_next_arrival():
                     break  # No more jobs
                 continue
-            
-            available_jobs.sort(key=lambda x: x[1].remaining_time)
-            job_index, job = available_jobs[0]
+
+            remaining_time, job_index = heapq.heappop(ready)
+            if self.costs and job_index != self.last_job:
+                self.switch_to(job_index)  # First, so the slice still ends at the next arrival
             next_arrival = self.arriving_job()
-            
+
             if next_arrival == float('inf'):
-                run_time = job.remaining_time  # Run until done
+                run_time = remaining_time  # Run until done
             else:
-                run_time = min(job.remaining_time, next_arrival - self.current_time)
-            
-            self.run(job_index, run_time)
-    
+                run_time = min(remaining_time, max(0, next_arrival - self.current_time))
+                if not run_time and remaining_time:
+                    heapq.heappush(ready, (remaining_time, job_index))  # Arrived during the switch
+                    continue
+
+            if not self.run(job_index, run_time):
+                heapq.heappush(ready, (self.jobs.remaining_time[job_index], job_index))
+
     def rr(self):        
+        if self.quantum >= max(self.jobs.run_time):
+            self.fifo()  # No job ever uses up a quantum, so nothing is preempted
+            return
+
+        since_fast_forward = len(self.jobs)  # Quanta dispatched since the last fast-forward attempt
+        if self.resumed is not None:
+            ready, since_fast_forward = self.resumed
+            self.ready_queue.extend(ready)
+        checkpoint = self.checkpoint
+
         while self.completed_jobs < len(self.jobs):
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save(self, self.ready_queue, since_fast_forward)
             self.update_ready_queue() # This is an ordered queue of jobs to keep "fairness"
             
             if not self.ready_queue:  # No jobs ready
                 if not self.advance_to_next_arrival():
                     break  # No more jobs
                 continue
+
+            # Checking costs one pass over the queue, so only retry after a full rotation
+            if self.fast_forward and not self.every_slice and since_fast_forward >= len(self.ready_queue):
+                self.fast_forward_rounds()
+                since_fast_forward = 0
             
-            job_index = self.ready_queue.pop(0)
-            run_time = min(self.quantum, self.jobs[job_index].remaining_time)
-            old_time = self.current_time
+            job_index = self.ready_queue.popleft()
+            run_time = min(self.quantum, self.jobs.remaining_time[job_index])
             job_completed = self.run(job_index, run_time)
-            self.check_new_arrivals(old_time, job_index)
+            self.update_ready_queue() # Arrivals during the slice go ahead of the preempted job
+            since_fast_forward += 1
             
             if not job_completed:
                 self.ready_queue.append(job_index)
 
-    def available_jobs(self):
-        available_jobs = []
-        for i, job in enumerate(self.jobs):
-            if (job.arrival_time <= self.current_time and 
-                job.finish_time == -1):
-                available_jobs.append((i, job))
-        return available_jobs
-    
-    def arriving_job(self):
-        next_arrival = float('inf')
-        for i, job in enumerate(self.jobs):
-            if (job.arrival_time > self.current_time and 
-                job.arrival_time < next_arrival and 
-                job.finish_time == -1):
-                next_arrival = job.arrival_time
-        return next_arrival
-    
-    def check_new_arrivals(self, old_time, current_job_index):
-        new_arrivals = []
-        for i, job in enumerate(self.jobs):
-            if (job.arrival_time > old_time and 
-                job.arrival_time <= self.current_time and 
-                job.finish_time == -1 and 
-                i not in self.ready_queue and
-                i != current_job_index):
-                
-                self.ready_queue.append(i)
-                new_arrivals.append((i, job.arrival_time))
-        return new_arrivals
+    def fast_forward_rounds(self):
+        # While no job finishes and nothing arrives, every quantum is a full one and a
+        # rotation leaves the queue in the same order, so whole rounds can be skipped
+        jobs = self.jobs
+        round_time = len(self.ready_queue) * self.quantum
+        rounds = min((jobs.remaining_time[i] - 1) // self.quantum for i in self.ready_queue)
+        next_arrival = self.arriving_job()
+        if next_arrival != float('inf'):
+            # The last skipped slice must end before the arrival, or it would queue mid-round
+            rounds = min(rounds, (next_arrival - self.current_time - 1) // round_time)
+        if rounds <= 0:
+            return
+
+        for position, i in enumerate(self.ready_queue):
+            if jobs.start_time[i] == -1:
+                jobs.start_time[i] = self.current_time + position * self.quantum
+            jobs.remaining_time[i] -= rounds * self.quantum
+        self.current_time += rounds * round_time
+
+    def mlfq(self):
+        # One FIFO queue per level, and bit k of `waiting` is set while level k has jobs,
+        # so the highest non-empty level is always the lowest set bit
+        jobs = self.jobs
+        quanta = self.level_quanta
+        bottom = len(quanta) - 1
+        levels = [deque() for _ in quanta]
+        waiting = 0
+        used = array('q', [0]) * len(jobs)  # Time charged against the allotment at the job's level
+        next_boost = self.boost or float('inf')
+
+        while self.completed_jobs < len(jobs):
+            for i in self.admit_arrivals():
+                levels[0].append(i)  # New jobs start at the top
+                waiting |= 1
+
+            if self.current_time >= next_boost:
+                for level in levels[1:]:
+                    for i in level:
+                        used[i] = 0
+                    levels[0].extend(level)
+                    level.clear()
+                waiting = 1 if levels[0] else 0
+                next_boost += ((self.current_time - next_boost) // self.boost + 1) * self.boost
+
+            if not waiting:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            k = (waiting & -waiting).bit_length() - 1
+            queue = levels[k]
+            job_index = queue.popleft()
+            if not queue:
+                waiting ^= 1 << k
+
+            # A slice is what is left of the job's quantum, cut short by a boost or, below
+            # the top level, by an arrival, which outranks it. Both count from the end of the
+            # switch, and a slice the switch used up leaves the job at the head of its level
+            if self.costs and job_index != self.last_job:
+                self.switch_to(job_index)
+            quantum = quanta[k]
+            run_time = min(quantum - used[job_index] % quantum, jobs.remaining_time[job_index],
+                           max(0, next_boost - self.current_time))
+            if k:
+                run_time = min(run_time, max(0, self.arriving_job() - self.current_time))
+            if (run_time or not jobs.remaining_time[job_index]) and self.run(job_index, run_time):
+                continue
+
+            for i in self.admit_arrivals():
+                levels[0].append(i)  # Arrivals during the slice go ahead of the preempted job
+                waiting |= 1
+            used[job_index] += run_time
+            if k < bottom and used[job_index] >= self.allotment * quantum:
+                used[job_index] = 0  # Allotment spent: move down a level
+                k += 1
+                levels[k].append(job_index)
+            elif not run_time or used[job_index] % quantum:
+                levels[k].appendleft(job_index)  # Preempted mid-quantum, resumes first
+            else:
+                levels[k].append(job_index)
+            waiting |= 1 << k
+
+    def cfs(self):
+        # Runnable jobs sit in a heap of (vruntime, job_index). Each pick runs the job that
+        # has had the least weighted CPU time for its share of the scheduling period
+        jobs = self.jobs
+        weight = self.job_weights()
+        vruntime = array('q', [0]) * len(jobs)
+        ready = []
+        load = 0  # Total weight of runnable jobs
+        min_vruntime = 0  # Never decreases; new jobs start here so they cannot hog the CPU
+        latency_jobs = self.latency // self.granularity  # Jobs that fit in one target latency
+        job_count = len(jobs)
+
+        while self.completed_jobs < job_count:
+            if self.arriving_job() <= self.current_time:
+                for i in self.admit_arrivals():
+                    vruntime[i] = min_vruntime
+                    heapq.heappush(ready, (min_vruntime, i))
+                    load += weight[i]
+
+            if not ready:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            job_index = ready[0][1]  # Stays on the heap while it runs
+            period = self.latency if len(ready) <= latency_jobs else len(ready) * self.granularity
+            slice_time = max(period * weight[job_index] // load, self.granularity)
+            run_time = min(slice_time, jobs.remaining_time[job_index])
+
+            if self.run(job_index, run_time):
+                heapq.heappop(ready)
+                load -= weight[job_index]
+            else:
+                vruntime[job_index] += run_time * VRUNTIME_SCALE // weight[job_index]
+                heapq.heapreplace(ready, (vruntime[job_index], job_index))  # One sift instead of pop and push
+            if ready:
+                min_vruntime = max(min_vruntime, ready[0][0])
+
+    def job_weights(self): # Per-job CPU share weights (CFS weights, lottery and stride tickets)
+        nice = self.jobs.nice
+        if nice is None:
+            return [NICE_0_WEIGHT] * len(self.jobs)
+        return [nice_weight(n) for n in nice]
+
+    def lottery(self):
+        # Every quantum goes to the holder of a ticket drawn uniformly from the ready jobs'
+        jobs = self.jobs
+        tickets = self.job_weights()
+        ready = TicketTree(len(jobs))
+        waiting = 0
+        draws = random.Random(self.seed)
+        job_count = len(jobs)
+
+        while self.completed_jobs < job_count:
+            for i in self.admit_arrivals():
+                ready.add(i, tickets[i])
+                waiting += 1
+
+            if not waiting:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            if waiting == 1:
+                job_index = ready.holder(0)
+                if self.costs and job_index != self.last_job:
+                    self.switch_to(job_index)  # The arrival cut counts from the end of the switch
+                run_time = self.uncontended_run_time(job_index)  # Every draw would pick it anyway
+            else:
+                job_index = ready.holder(draws.randrange(ready.total))
+                run_time = min(self.quantum, jobs.remaining_time[job_index])
+            if self.run(job_index, run_time):
+                ready.add(job_index, -tickets[job_index])
+                waiting -= 1
+
+    def stride(self):
+        # Deterministic proportional share: each job's pass advances by STRIDE1 / tickets per
+        # quantum and the lowest pass runs next, from a heap of (pass, job_index)
+        jobs = self.jobs
+        strides = [STRIDE1 // tickets for tickets in self.job_weights()]
+        ready = []
+        global_pass = 0  # Never decreases; new jobs start here so they cannot hog the CPU
+        job_count = len(jobs)
+
+        while self.completed_jobs < job_count:
+            for i in self.admit_arrivals():
+                heapq.heappush(ready, (global_pass, i))
+
+            if not ready:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            current_pass, job_index = ready[0]
+            if len(ready) == 1:
+                if self.costs and job_index != self.last_job:
+                    self.switch_to(job_index)  # The arrival cut counts from the end of the switch
+                run_time = self.uncontended_run_time(job_index)
+            else:
+                run_time = min(self.quantum, jobs.remaining_time[job_index])
+            if self.run(job_index, run_time):
+                heapq.heappop(ready)
+            else:
+                quanta = run_time // self.quantum  # Only a job's last slice can be short
+                heapq.heapreplace(ready, (current_pass + quanta * strides[job_index], job_index))
+            if ready:
+                global_pass = max(global_pass, ready[0][0])
+
+    def uncontended_run_time(self, job_index):
+        # A lone ready job keeps the CPU through every slice that ends before a job
+        # arrives, so those quanta run as one; there is always at least one
+        remaining = self.jobs.remaining_time[job_index]
+        next_arrival = self.arriving_job()
+        if next_arrival == float('inf'):
+            return remaining
+        return min(remaining, max(1, -(-(next_arrival - self.current_time) // self.quantum)) * self.quantum)
+
+    def realtime(self):
+        # Each job row is a task. A task's first instance is released at its arrival time
+        # and a periodic task's next release is only queued when the current one happens,
+        # so memory follows the number of tasks, not the number of instances. The ready
+        # heap holds [priority, task, release, remaining, start] and is preemptive at releases.
+        # Percentiles are over instances, so they are sketched here as instances finish
+        jobs = self.jobs
+        task_count = len(jobs)
+        deadline = jobs.deadline or array('q', [0]) * task_count
+        period = jobs.period or array('q', [0]) * task_count
+        instances = array('q', [0]) * task_count
+        tat_total = array('q', [0]) * task_count
+        wt_total = array('q', [0]) * task_count
+        rt_total = array('q', [0]) * task_count
+        misses = array('q', [0]) * task_count
+        horizon = self.realtime_horizon()
+        edf = self.algorithm == ScheduleType.EDF
+        ready = []
+        releases = []  # heap of (release time, task) for the next instance of periodic tasks
+        inf = float('inf')
+        last = None  # Instance the CPU holds
+        timeline = self.timeline
+        self.sketches = tat_sketch, wt_sketch, rt_sketch = QuantileSketch(), QuantileSketch(), QuantileSketch()
+
+        def release(task, now):
+            relative = deadline[task] or period[task] or inf  # Implicit deadline: the period
+            if edf:
+                priority = now + relative
+            else:
+                priority = period[task] or relative  # Shorter period first, one-shot jobs by deadline
+            heapq.heappush(ready, [priority, task, now, jobs.run_time[task], -1])
+            if period[task] and now + period[task] < horizon:
+                heapq.heappush(releases, (now + period[task], task))
+
+        while True:
+            # A switch can carry the clock past a release, which still counts from when it was due
+            for task in self.admit_arrivals():
+                release(task, max(jobs.arrival_time[task], 0))
+            while releases and releases[0][0] <= self.current_time:
+                release(*reversed(heapq.heappop(releases)))
+
+            next_release = min(self.arriving_job(), releases[0][0] if releases else inf)
+            if not ready:
+                if next_release == inf:
+                    break  # No more jobs
+                self.current_time = next_release
+                continue
+
+            instance = ready[0]
+            if self.costs and instance is not last:  # Charged before the slice is sized, as in srtn()
+                overhead = self.switch_cost
+                if instance[3] < jobs.run_time[instance[1]]:
+                    overhead += self.warmup  # Resuming after preemption
+                self.current_time += overhead
+                self.overhead += overhead
+                self.switches += 1
+                last = instance
+            run_time = min(instance[3], max(0, next_release - self.current_time))
+            if not run_time and instance[3]:
+                continue  # A release came due during the switch and may outrank this instance
+            if instance[4] == -1:
+                instance[4] = self.current_time
+            self.current_time += run_time
+            instance[3] -= run_time
+            if timeline is not None:
+                timeline.record(instance[1], self.current_time - run_time, run_time)
+            if instance[3] == 0:
+                heapq.heappop(ready)
+                _, task, released, _, start = instance
+                turnaround = self.current_time - released
+                instances[task] += 1
+                tat_total[task] += turnaround
+                wt_total[task] += turnaround - jobs.run_time[task]
+                rt_total[task] += start - released
+                tat_sketch.add(turnaround)
+                wt_sketch.add(turnaround - jobs.run_time[task])
+                rt_sketch.add(start - released)
+                if self.current_time > released + (deadline[task] or period[task] or inf):
+                    misses[task] += 1
+
+        self.completed_jobs = task_count
+        self.realtime_results = (instances, tat_total, wt_total, rt_total, misses)
+
+    def ranked(self):
+        # SJF, HRRN and PRIORITY: whenever the CPU frees up, the best-ranked ready job runs
+        # to completion
+        jobs = self.jobs
+        ready = self.ready_heap(jobs.run_time)
+        while self.completed_jobs < len(jobs):
+            for i in self.admit_arrivals():
+                ready.push(i, jobs.arrival_time[i])
+            ready.advance(self.current_time)
+
+            if not ready:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+            job_index = ready.pop()
+            self.run(job_index, jobs.remaining_time[job_index])
+
+    def ready_heap(self, length): # length: the CPU time each job will ask for when picked
+        size = len(self.jobs)
+        if self.algorithm == ScheduleType.HRRN:
+            return ResponseRatioHeap(size, length)
+        if self.algorithm == ScheduleType.PRIORITY:
+            return AgingHeap(size, self.jobs.nice or array('q', [0]) * size, self.aging)
+        return ReadyHeap(size, length)
+
+    def realtime_horizon(self):
+        # One hyperperiod past the last first release, unless the periods make that too
+        # long to be useful, in which case REALTIME_PERIODS of the longest period
+        if self.horizon:
+            return self.horizon
+        periods = set(self.jobs.period or ()) - {0}
+        if not periods:
+            return 0
+        limit = REALTIME_PERIODS * max(periods)
+        hyperperiod = 1
+        for period in periods:
+            hyperperiod = math.lcm(hyperperiod, period)
+            if hyperperiod >= limit:
+                hyperperiod = limit
+                break
+        return max(self.jobs.arrival_time) + hyperperiod
+
+    def admit_arrivals(self): # Moves the arrival cursor past every job that has arrived by now
+        first = cursor = self.next_arrival
+        arrival_time = self.jobs.arrival_time
+        while cursor < len(arrival_time) and arrival_time[cursor] <= self.current_time:
+            cursor += 1
+        self.next_arrival = cursor
+        return range(first, cursor)
+
+    def arriving_job(self): # Jobs are sorted by arrival, so the cursor is the next arrival
+        if self.next_arrival < len(self.jobs):
+            return self.jobs.arrival_time[self.next_arrival]
+        return float('inf')
 
     def find_next_arrival_time(self):
-        next_time = float('inf')
-        for job in self.jobs:
-            if job.finish_time == -1 and job.arrival_time > self.current_time:
-                next_time = min(next_time, job.arrival_time)
-        return next_time
+        return self.arriving_job()
 
     def advance_to_next_arrival(self):
         next_time = self.find_next_arrival_time()
@@ -180,66 +1037,669 @@ class SchedulerSimulator:
         return False
 
     def update_ready_queue(self): # Jobs are added to queue and ordered
-        new_arrivals = []
-        for i, job in enumerate(self.jobs):
-            if (job.arrival_time <= self.current_time and 
-                job.finish_time == -1 and 
-                i not in self.ready_queue):
-                self.ready_queue.append(i)
-                new_arrivals.append(i)
+        self.ready_queue.extend(self.admit_arrivals())
 
-    def print_results(self):
-        total_tat = 0.0 
-        total_wt = 0.0  
+    def job_metrics(self): # Per-job turnaround, wait and response, in job ID order
+        jobs = self.jobs
+        if self.realtime_results is not None:
+            return self.realtime_metrics()
+        if np is not None:
+            arrival = np.frombuffer(jobs.arrival_time, dtype=np.int64)
+            tat = np.frombuffer(jobs.finish_time, dtype=np.int64) - arrival
+            wt = tat - np.frombuffer(jobs.run_time, dtype=np.int64)
+            if jobs.io_time is not None:
+                wt -= np.frombuffer(jobs.io_time, dtype=np.int64)  # Blocked is not waiting
+            return tat, wt, np.frombuffer(jobs.start_time, dtype=np.int64) - arrival
+        tat = array('q', map(sub, jobs.finish_time, jobs.arrival_time))
+        wt = array('q', map(sub, tat, jobs.run_time))
+        if jobs.io_time is not None:
+            wt = array('q', map(sub, wt, jobs.io_time))
+        return tat, wt, array('q', map(sub, jobs.start_time, jobs.arrival_time))
+
+    def realtime_metrics(self): # Per-task means over its instances
+        instances, tat_total, wt_total, rt_total, _ = self.realtime_results
+        if np is not None:
+            count = np.frombuffer(instances, dtype=np.int64)
+            return tuple(np.frombuffer(total, dtype=np.int64) / count for total in (tat_total, wt_total, rt_total))
+        return tuple(array('d', map(truediv, total, instances)) for total in (tat_total, wt_total, rt_total))
+
+    def policy_parameters(self): # Everything besides the jobs that shapes the schedule
+        parameters = {'algorithm': self.algorithm.value,
+                      'quantum': self.quantum if self.algorithm in QUANTUM_POLICIES else None}
+        if self.algorithm == ScheduleType.MLFQ:
+            parameters.update(levels=','.join(map(str, self.level_quanta)), boost=self.boost,
+                              allotment=self.allotment)
+        elif self.algorithm == ScheduleType.CFS:
+            parameters.update(latency=self.latency, granularity=self.granularity)
+        elif self.algorithm == ScheduleType.LOTTERY:
+            parameters.update(seed=self.seed)
+        elif self.algorithm in REALTIME_POLICIES:
+            parameters.update(horizon=self.horizon)
+        elif self.algorithm == ScheduleType.PRIORITY:
+            parameters.update(aging=self.aging)
+        return parameters
 
-        sorted_jobs = sorted(self.jobs, key=lambda job: job.id)
+    def print_results(self, metrics=None):
+        tat, wt, rt = metrics or self.job_metrics()
 
-        for job in sorted_jobs:
-            tat = job.finish_time - job.arrival_time  
-            wt = tat - job.run_time               
-            total_tat += tat
-            total_wt += wt
-            print(f"Job {job.id:3d} -- Turnaround {tat:3.2f}  Wait {wt:3.2f}")
+        for first in range(0, len(tat), RESULT_CHUNK):
+            ids = range(first, first + RESULT_CHUNK)
+            chunk_tat = tat[first:first + RESULT_CHUNK].tolist()
+            chunk_wt = wt[first:first + RESULT_CHUNK].tolist()
+            sys.stdout.write("".join(f"Job {i:3d} -- Turnaround {t:3.2f}  Wait {w:3.2f}\n"
+                                     for i, t, w in zip(ids, chunk_tat, chunk_wt)))
 
-        avg_tat = total_tat / len(sorted_jobs)
-        avg_wt = total_wt / len(sorted_jobs)
+        avg_tat, avg_wt = self.average_metrics((tat, wt, rt))
         print(f"Average -- Turnaround {avg_tat:3.2f}  Wait {avg_wt:3.2f}")
+        self.print_tails(self.sketches or metric_sketches(tat, wt, rt))
+        if self.algorithm in FAIR_SHARE_POLICIES:
+            jain, worst = fairness_metrics(tat, wt)
+            print(f"Fairness -- Jain {jain:1.4f}  Max slowdown {worst:3.2f}")
+        if self.algorithm in RANKED_POLICIES:
+            starved = max(range(len(wt)), key=wt.__getitem__)
+            print(f"Starvation -- Longest wait {wt[starved]:3.2f} (job {starved})")
+        if self.realtime_results is not None:
+            instances, _, _, _, misses = self.realtime_results
+            released, missed = column_total(instances), column_total(misses)
+            print(f"Deadlines -- Missed {missed} of {released} instances ({100.0 * missed / released:3.2f}%)")
+        if self.costs:
+            self.print_switches()
+
+    def print_tails(self, sketches):
+        print(f"Response -- Average {sketches[2].mean():3.2f}")
+        for percentile, t, w, r in zip(TAIL_PERCENTILES, *(sketch.quantiles(TAIL_PERCENTILES) for sketch in sketches)):
+            print(f"p{100 * percentile:g} -- Turnaround {t:3.2f}  Wait {w:3.2f}  Response {r:3.2f}")
+
+    def print_switches(self):
+        share = 100.0 * self.overhead / self.current_time if self.current_time else 0.0
+        print(f"Switches -- Count {self.switches}  Overhead {self.overhead} ({share:3.2f}%)")
+
+    def average_metrics(self, metrics=None):
+        if self.realtime_results is not None:  # Over every instance rather than every task
+            instances, tat_total, wt_total, _, _ = self.realtime_results
+            released = column_total(instances)
+            return float(column_total(tat_total)) / released, float(column_total(wt_total)) / released
+        tat, wt, _ = metrics or self.job_metrics()
+        # Integer totals are exact, unlike a running float sum
+        return float(column_total(tat)) / len(tat), float(column_total(wt)) / len(tat)
+
+def metric_sketches(*columns): # A QuantileSketch per column
+    sketches = tuple(QuantileSketch() for _ in columns)
+    for sketch, column in zip(sketches, columns):
+        sketch.extend(column)
+    return sketches
+
+def fairness_metrics(tat, wt):
+    # Jain's index over per-job slowdown (turnaround / run time): 1.0 when every job is
+    # stretched by the same factor, approaching 1/n when one job absorbs all the delay.
+    # Zero-length jobs count as length 1, so no slowdown is below 1
+    slowdown = [max(t, 1) / max(t - w, 1) for t, w in zip(tat.tolist(), wt.tolist())]
+    total = math.fsum(slowdown)
+    squares = math.fsum(x * x for x in slowdown)
+    return total * total / (len(slowdown) * squares), max(slowdown)
+
+class StreamingSimulator(SchedulerSimulator):
+    # Replays a job file that is already sorted by arrival without loading it. Jobs are
+    # read as the clock reaches them and dropped once their result line is written, so
+    # memory follows the number of live jobs rather than the length of the trace.
+    # Result lines still come out in job ID order: results that finish ahead of a lower
+    # ID wait in memory, and past STREAM_REORDER_LIMIT of them they are written to a
+    # temporary file as a sorted run, to be merged back in as the gap closes
+    def __init__(self, job_file, algorithm=ScheduleType.FIFO, quantum=1, fast_forward=True):
+        super().__init__(job_file, algorithm, quantum, fast_forward)
+        self.arrivals = None  # Job generator over the file
+        self.upcoming = None  # Next job not yet arrived, read one ahead
+        self.jobs_read = 0  # Also the next job ID, since the file is in arrival order
+        self.finished = {}  # (turnaround, wait) by job ID, waiting for every lower ID to finish
+        self.spill = None  # Temporary file of the sorted runs spilled from finished
+        self.runs = []  # heap of (job ID, turnaround, wait, run) at the head of each spilled run
+        self.next_result = 0  # Lowest job ID whose result has not been written
+        self.total_tat = 0
+        self.total_wt = 0
+        self.sketches = (QuantileSketch(), QuantileSketch(), QuantileSketch())  # Finished jobs are not kept
+
+    def stream_jobs(self):
+        last_arrival = None
+        for job in self.read_jobs():
+            if last_arrival is not None and job.arrival_time < last_arrival:
+                print(f"Error: File '{self.job_file}' is not sorted by arrival time.")
+                sys.exit(1)
+            last_arrival = job.arrival_time
+            yield job
+
+    def read_jobs(self):
+        if is_binary_trace(self.job_file):
+            try:
+                run_time, arrival_time = load_trace(self.job_file)[:2]
+            except TraceError as e:
+                print(f"Error: {e}.")
+                sys.exit(1)
+            for job in zip(run_time, arrival_time):
+                yield Job(*job)
+            return
+
+        try:
+            with open(self.job_file, 'r') as file:
+                for line in file:
+                    parts = line.strip().split()
+                    if 2 <= len(parts) <= 5:
+                        yield Job(int(parts[0]), int(parts[1])) #order Burst-Time, Arrival Time
+        except FileNotFoundError:
+            print(f"Error: File '{self.job_file}' not found.")
+            sys.exit(1)
+        except ValueError:
+            print(f"Error: Invalid job format in file '{self.job_file}'.")
+            sys.exit(1)
+
+    def simulate(self):
+        self.arrivals = self.stream_jobs()
+        self.upcoming = next(self.arrivals, None)
+        self.jobs_read = 0
+        self.current_time = 0
+        self.completed_jobs = 0
+
+        if self.algorithm == ScheduleType.SRTN:
+            self.srtn()
+        elif self.algorithm == ScheduleType.RR:
+            self.rr()
+        else:
+            self.fifo()
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+
+    def admit_arrivals(self): # Jobs get IDs in arrival order as they are read
+        arrived = []
+        while self.upcoming is not None and self.upcoming.arrival_time <= self.current_time:
+            arrived.append(self.next_job())
+        return arrived
+
+    def arriving_job(self):
+        if self.upcoming is not None:
+            return self.upcoming.arrival_time
+        return float('inf')
+
+    def run(self, job, run_time):
+        if job.start_time == -1:
+            job.start_time = self.current_time
+        
+        self.current_time += run_time
+        job.remaining_time -= run_time
+        
+        if job.remaining_time == 0: # job completed?
+            job.finish_time = self.current_time
+            self.retire(job)
+            return True  
+        return False  
+
+    def retire(self, job): # Records a finished job and writes every result that is now in order
+        tat = job.finish_time - job.arrival_time
+        wt = tat - job.run_time
+        self.total_tat += tat
+        self.total_wt += wt
+        tat_sketch, wt_sketch, rt_sketch = self.sketches
+        tat_sketch.add(tat)
+        wt_sketch.add(wt)
+        rt_sketch.add(job.start_time - job.arrival_time)
+        self.completed_jobs += 1
+        self.finished[job.id] = (tat, wt)
+        self.write_results()
+        if len(self.finished) >= STREAM_REORDER_LIMIT:
+            self.spill_results()
+        if self.completed_jobs % STREAM_REPORT_INTERVAL == 0:
+            sys.stdout.write(f"Running -- Completed {self.completed_jobs}  Turnaround "
+                             f"{self.total_tat / self.completed_jobs:3.2f}  Wait {self.total_wt / self.completed_jobs:3.2f}\n")
+
+    def write_results(self): # Writes every result now in order, from memory or the spilled runs
+        finished, runs = self.finished, self.runs
+        lines = []
+        while True:
+            if self.next_result in finished:
+                tat, wt = finished.pop(self.next_result)
+            elif runs and runs[0][0] == self.next_result:
+                _, tat, wt, run = runs[0]
+                self.advance_run(run)
+            else:
+                break
+            lines.append(f"Job {self.next_result:3d} -- Turnaround {tat:3.2f}  Wait {wt:3.2f}\n")
+            self.next_result += 1
+            if len(lines) == RESULT_CHUNK:  # A long run of them comes out when a gap closes
+                sys.stdout.write("".join(lines))
+                lines = []
+        sys.stdout.write("".join(lines))
+
+    def spill_results(self):
+        records = array('q')
+        for job_id in sorted(self.finished):
+            records.extend((job_id, *self.finished[job_id]))
+        self.finished.clear()
+        if self.spill is None:
+            self.spill = tempfile.TemporaryFile()
+        start = self.spill.seek(0, os.SEEK_END)
+        records.tofile(self.spill)
+        run = [start, start + len(records) * records.itemsize, None, 0]  # Read position, end, records, index
+        self.read_run(run)
+        heapq.heappush(self.runs, (*run[2][:3], run))
+
+    def read_run(self, run):
+        size = min(STREAM_SPILL_READ * 3 * 8, run[1] - run[0])
+        self.spill.seek(run[0])
+        run[2] = array('q', self.spill.read(size))
+        run[0] += size
+        run[3] = 0
+
+    def advance_run(self, run): # Moves past the run's head, which has been written
+        run[3] += 3
+        if run[3] == len(run[2]):
+            if run[0] == run[1]:
+                heapq.heappop(self.runs)
+                return
+            self.read_run(run)
+        records, i = run[2], run[3]
+        heapq.heapreplace(self.runs, (records[i], records[i + 1], records[i + 2], run))
+
+    def next_job(self):
+        job = self.upcoming
+        job.id = self.jobs_read
+        self.jobs_read += 1
+        self.upcoming = next(self.arrivals, None)
+        return job
+
+    def fifo(self):
+        for job in self.admit_all():
+            if self.current_time < job.arrival_time:
+                self.current_time = job.arrival_time
+            self.run(job, job.run_time)
+
+    def admit_all(self): # FIFO never looks ahead, so it can take jobs straight off the file
+        while self.upcoming is not None:
+            yield self.next_job()
+
+    def srtn(self):
+        self.ready_queue = [] # heap of (remaining_time, job ID, job)
+
+        while True:
+            for job in self.admit_arrivals():
+                heapq.heappush(self.ready_queue, (job.remaining_time, job.id, job))
+
+            if not self.ready_queue:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            remaining_time, job_id, job = heapq.heappop(self.ready_queue)
+            next_arrival = self.arriving_job()
+
+            if next_arrival == float('inf'):
+                run_time = remaining_time  # Run until done
+            else:
+                run_time = min(remaining_time, next_arrival - self.current_time)
+
+            if not self.run(job, run_time):
+                heapq.heappush(self.ready_queue, (job.remaining_time, job_id, job))
+
+    def rr(self):
+        self.ready_queue = deque()
+        since_fast_forward = float('inf')
+
+        while True:
+            self.update_ready_queue()
+
+            if not self.ready_queue:
+                if not self.advance_to_next_arrival():
+                    break  # No more jobs
+                continue
+
+            if self.fast_forward and since_fast_forward >= len(self.ready_queue):
+                self.fast_forward_rounds()
+                since_fast_forward = 0
+
+            job = self.ready_queue.popleft()
+            job_completed = self.run(job, min(self.quantum, job.remaining_time))
+            self.update_ready_queue() # Arrivals during the slice go ahead of the preempted job
+            since_fast_forward += 1
+
+            if not job_completed:
+                self.ready_queue.append(job)
+
+    def fast_forward_rounds(self): # Same closed form as the batch engine, on job records
+        round_time = len(self.ready_queue) * self.quantum
+        rounds = min((job.remaining_time - 1) // self.quantum for job in self.ready_queue)
+        next_arrival = self.arriving_job()
+        if next_arrival != float('inf'):
+            rounds = min(rounds, (next_arrival - self.current_time - 1) // round_time)
+        if rounds <= 0:
+            return
+
+        for position, job in enumerate(self.ready_queue):
+            if job.start_time == -1:
+                job.start_time = self.current_time + position * self.quantum
+            job.remaining_time -= rounds * self.quantum
+        self.current_time += rounds * round_time
+
+    def print_results(self):
+        avg_tat = float(self.total_tat) / self.completed_jobs
+        avg_wt = float(self.total_wt) / self.completed_jobs
+        print(f"Average -- Turnaround {avg_tat:3.2f}  Wait {avg_wt:3.2f}")
+        self.print_tails(self.sketches)
+
+sweep_jobs = None  # (run_time, arrival_time) columns mapped once per sweep worker
+sweep_settings = {}  # Simulator keyword arguments shared by every configuration
+
+def init_sweep_worker(trace_file, settings=None):
+    global sweep_jobs, sweep_settings
+    sweep_jobs = load_trace(trace_file)
+    sweep_settings = settings or {}
+
+def run_sweep_configuration(configuration):
+    algorithm, quantum = configuration
+    simulator = SchedulerSimulator(None, algorithm, quantum or 1, **sweep_settings)
+    simulator.jobs.attach(*sweep_jobs)
+    simulator.simulate()
+    return simulator.average_metrics() + (simulator.switches, simulator.overhead)
+
+def sweep_configurations(algorithms, quanta):
+    configurations = []
+    for algorithm in algorithms:
+        if algorithm in QUANTUM_POLICIES:
+            configurations.extend((algorithm, q) for q in quanta)
+        else:
+            configurations.append((algorithm, None))
+    return configurations
+
+def run_sweep(job_file, algorithms, quanta, workers=None, settings=None):
+    # The trace is parsed once. Workers map the same sorted binary trace read-only, so
+    # the page cache holds one copy however many configurations run side by side.
+    # settings holds the other simulator options, the same for every row as in a single run
+    simulator = SchedulerSimulator(job_file)
+    simulator.read_file()
+    simulator.assign_job_ids()
+    if not len(simulator.jobs):
+        print(f"Error: No jobs in '{job_file}'.")
+        sys.exit(1)
+    if simulator.jobs.bursts is not None:
+        print("Error: --sweep does not support jobs with I/O bursts.")  # Binary traces hold one burst per job
+        sys.exit(1)
+    configurations = sweep_configurations(algorithms, quanta)
+
+    with tempfile.TemporaryDirectory() as scratch:
+        trace_file = os.path.join(scratch, 'sweep.bin')
+        columns = simulator.jobs.columns()
+        with TraceWriter(trace_file, len(columns)) as writer:
+            writer.write(*columns)
+        simulator = None
+        with Pool(workers, initializer=init_sweep_worker, initargs=(trace_file, settings)) as pool:
+            results = pool.map(run_sweep_configuration, configurations, chunksize=1)
+
+    costs = settings and (settings.get('switch_cost') or settings.get('warmup'))
+    print(f"{'Policy':<8}{'Quantum':>8}{'Turnaround':>14}{'Wait':>12}"
+          + (f"{'Switches':>12}{'Overhead':>12}" if costs else ""))
+    for (algorithm, quantum), (avg_tat, avg_wt, switches, overhead) in zip(configurations, results):
+        quantum = '-' if quantum is None else quantum
+        print(f"{algorithm.value:<8}{quantum:>8}{avg_tat:>14.2f}{avg_wt:>12.2f}"
+              + (f"{switches:>12}{overhead:>12}" if costs else ""))
+
+def parse_quanta(value): # "8", "1,2,4" or an inclusive range "1..64"
+    if '..' in value:
+        first, last = value.split('..', 1)
+        return list(range(int(first), int(last) + 1))
+    return [int(q) for q in value.split(',')]
 
 def parse_arguments():
     if len(sys.argv) < 2:
-        print("Usage: schedSim <job-file.txt> [-p <ALGORITHM>] [-q <QUANTUM>]")
+        print("Usage: schedSim <job-file.txt|trace.bin> [-p <ALGORITHM>] [-q <QUANTUM>] [--stream] [--no-cache] [--events]")
+        print("       schedSim <job-file.txt|trace.bin> -p CFS [--latency <PERIOD>] [--granularity <SLICE>]")
+        print("       schedSim <job-file.txt|trace.bin> -p LOTTERY|STRIDE [-q <QUANTUM>] [--seed <SEED>]")
+        print("       schedSim <job-file.txt|trace.bin> -p EDF|RM [--horizon <TIME>]")
+        print("       schedSim <job-file.txt|trace.bin> -p SJF|HRRN|PRIORITY [--aging <INTERVAL>]")
+        print("       schedSim <job-file.txt|trace.bin> -p MLFQ [-q <QUANTUM>] [-l <LEVELS>|<Q>,<Q>...] [--boost <PERIOD>] [--allotment <QUANTA>]")
+        print("       schedSim <job-file.txt|trace.bin> -c <CPUS> [-b least|rr|random] [-p <ALGORITHM>] [-q <QUANTUM>]")
+        print("       schedSim <job-file.txt|trace.bin> --sweep [-p <ALG>,<ALG>...] [-q <Q>..<Q>] [-j <WORKERS>]")
+        print("       Costs, in any mode but --stream: [--switch <COST>] [--warmup <COST>]")
+        print("       Gantt timeline, on one CPU without --stream: [--timeline <FILE.bin|FILE.csv|FILE.svg|->]")
+        print("       schedSim <job-file.txt|trace.bin> -p SRTN|RR --checkpoint <FILE> [--interval <SECONDS>] [--resume]")
+        print("       schedSim <job-file.txt|trace.bin> [--plugin <MODULE>:<CLASS>] [--profile]  (on the event engine)")
         sys.exit(1)
     
     job_file = sys.argv[1]
     algorithm = ScheduleType.FIFO
     quantum = 1 
+    options = {'stream': False, 'sweep': False, 'cache': True, 'algorithms': list(ScheduleType),
+               'quanta': None, 'workers': None, 'cpus': None, 'balancer': 'least',
+               'levels': MLFQ_LEVELS, 'level_quanta': None, 'boost': 0, 'allotment': 1,
+               'latency': CFS_LATENCY, 'granularity': CFS_GRANULARITY, 'seed': 0, 'horizon': None, 'events': False,
+               'switch': 0, 'warmup': 0, 'aging': AGING_INTERVAL, 'timeline': None,
+               'checkpoint': None, 'interval': None, 'resume': False, 'plugin': None, 'profile': False}
     i = 2
 
     while i < len(sys.argv):
+        if sys.argv[i] == '--stream':
+            options['stream'] = True  # Input must already be sorted by arrival
+            i += 1
+            continue
+        if sys.argv[i] == '--sweep':
+            options['sweep'] = True
+            i += 1
+            continue
+        if sys.argv[i] == '--no-cache':
+            options['cache'] = False
+            i += 1
+            continue
+        if sys.argv[i] == '--events':
+            options['events'] = True  # Event-driven engine, as used for jobs with I/O bursts
+            i += 1
+            continue
+        if sys.argv[i] == '--resume':
+            options['resume'] = True  # Start from the --checkpoint snapshot, if there is one
+            i += 1
+            continue
+        if sys.argv[i] == '--profile':
+            options['profile'] = True  # Count events and time each policy callback
+            i += 1
+            continue
         if i + 1 >= len(sys.argv):
             break
         if sys.argv[i] == '-p' or sys.argv[i] == '-P':
+            algorithms = []
+            for name in sys.argv[i + 1].split(','):
+                try:
+                    algorithms.append(ScheduleType(name))
+                except ValueError:
+                    pass
+            if algorithms:
+                algorithm = algorithms[0]
+                options['algorithms'] = algorithms
+        elif sys.argv[i] == '-q' or sys.argv[i] == '-Q':
             try:
-                algorithm = ScheduleType(sys.argv[i + 1])
+                quanta = [q for q in parse_quanta(sys.argv[i + 1]) if q > 0]
+                if quanta:
+                    quantum = quanta[0]
+                    options['quanta'] = quanta
             except ValueError:
                 pass
-        elif sys.argv[i] == '-q' or sys.argv[i] == '-Q':
+        elif sys.argv[i] == '-c' or sys.argv[i] == '-C':
             try:
-                q = int(sys.argv[i + 1])
-                if q > 0:
-                    quantum = q
+                if int(sys.argv[i + 1]) > 0:
+                    options['cpus'] = int(sys.argv[i + 1])
+            except ValueError:
+                pass
+        elif sys.argv[i] == '-b' or sys.argv[i] == '-B':
+            options['balancer'] = sys.argv[i + 1]
+        elif sys.argv[i] == '-j' or sys.argv[i] == '-J':
+            try:
+                if int(sys.argv[i + 1]) > 0:
+                    options['workers'] = int(sys.argv[i + 1])
+            except ValueError:
+                pass
+        elif sys.argv[i] == '-l' or sys.argv[i] == '-L':
+            try:
+                levels = [int(q) for q in sys.argv[i + 1].split(',')]  # A level count or one quantum per level
+                if all(q > 0 for q in levels):
+                    if len(levels) == 1:
+                        options['levels'] = levels[0]
+                    else:
+                        options['level_quanta'] = levels
+            except ValueError:
+                pass
+        elif sys.argv[i] in ('--boost', '--switch', '--warmup', '--aging'):
+            try:
+                if int(sys.argv[i + 1]) >= 0:
+                    options[sys.argv[i][2:]] = int(sys.argv[i + 1])
+            except ValueError:
+                pass
+        elif sys.argv[i] == '--timeline':
+            options['timeline'] = sys.argv[i + 1]  # '-' prints a text chart after the results
+        elif sys.argv[i] == '--checkpoint':
+            options['checkpoint'] = sys.argv[i + 1]
+        elif sys.argv[i] == '--plugin':
+            options['plugin'] = sys.argv[i + 1]  # A burstSim.ReadyPolicy subclass, as module:Class
+        elif sys.argv[i] == '--interval':
+            try:
+                if int(sys.argv[i + 1]) >= 0:
+                    options['interval'] = int(sys.argv[i + 1])
+            except ValueError:
+                pass
+        elif sys.argv[i] == '--seed':
+            try:
+                options['seed'] = int(sys.argv[i + 1])
+            except ValueError:
+                pass
+        elif sys.argv[i] in ('--allotment', '--latency', '--granularity', '--horizon'):
+            try:
+                if int(sys.argv[i + 1]) > 0:
+                    options[sys.argv[i][2:]] = int(sys.argv[i + 1])
             except ValueError:
                 pass
         i += 2  # Next flag-value pair
-    return job_file, algorithm, quantum
+    return job_file, algorithm, quantum, options
 
 def main():
-    job_file, algorithm, quantum = parse_arguments()
-    simulator = SchedulerSimulator(job_file, algorithm, quantum)
+    job_file, algorithm, quantum, options = parse_arguments()
+    if options['timeline'] is not None and (options['sweep'] or options['stream'] or options['cpus'] is not None):
+        print("Error: --timeline is not supported with --sweep, --stream or -c.")
+        sys.exit(1)
+    if options['plugin'] is not None or options['profile']:
+        if options['sweep'] or options['stream'] or options['cpus'] is not None or options['checkpoint'] is not None:
+            print("Error: --plugin and --profile are not supported with --sweep, --stream, -c or --checkpoint.")
+            sys.exit(1)
+    if options['checkpoint'] is not None:
+        if options['sweep'] or options['stream'] or options['cpus'] is not None or options['timeline'] is not None:
+            print("Error: --checkpoint is not supported with --sweep, --stream, -c or --timeline.")
+            sys.exit(1)
+        if algorithm not in (ScheduleType.SRTN, ScheduleType.RR) or options['events']:
+            print(f"Error: --checkpoint supports SRTN and RR, not {algorithm.value}{' with --events' if options['events'] else ''}.")
+            sys.exit(1)
+        if not os.path.isfile(job_file):
+            print(f"Error: File '{job_file}' not found.")
+            sys.exit(1)
+    elif options['resume']:
+        print("Error: --resume needs the --checkpoint file to resume from.")
+        sys.exit(1)
+    if options['sweep']:
+        settings = dict(levels=options['levels'], level_quanta=options['level_quanta'], boost=options['boost'],
+                        allotment=options['allotment'], latency=options['latency'],
+                        granularity=options['granularity'], seed=options['seed'], horizon=options['horizon'],
+                        switch_cost=options['switch'], warmup=options['warmup'], aging=options['aging'])
+        run_sweep(job_file, options['algorithms'], options['quanta'] or [quantum], options['workers'], settings)
+        return
+
+    if options['cpus'] is not None:
+        from smpSim import BALANCERS, SMP_POLICIES, SMPSimulator
+        if options['balancer'] not in BALANCERS:
+            print(f"Error: Unknown balancer '{options['balancer']}', expected one of {', '.join(BALANCERS)}.")
+            sys.exit(1)
+        if algorithm not in SMP_POLICIES:
+            print(f"Error: {algorithm.value} is not supported with -c.")
+            sys.exit(1)
+        simulator = SMPSimulator(job_file, algorithm, quantum, options['cpus'], options['balancer'],
+                                 options['switch'], options['warmup'])
+        simulator.read_file()
+        if simulator.jobs.bursts is not None:
+            print("Error: -c does not support jobs with I/O bursts.")
+            sys.exit(1)
+        simulator.assign_job_ids()
+        simulator.simulate()
+        simulator.print_results()
+        return
+
+    if options['stream']:
+        if algorithm not in STREAM_POLICIES:
+            print(f"Error: {algorithm.value} is not supported with --stream.")
+            sys.exit(1)
+        if options['switch'] or options['warmup']:
+            print("Error: --switch and --warmup are not supported with --stream.")
+            sys.exit(1)
+        simulator = StreamingSimulator(job_file, algorithm, quantum)
+        simulator.simulate()
+        simulator.print_results()
+        return
+
+    timeline = None
+    if options['timeline'] is not None:
+        from schedTimeline import TimelineRecorder
+        try:
+            timeline = TimelineRecorder(options['timeline'])
+        except OSError as e:
+            print(f"Error: Cannot write timeline '{options['timeline']}': {e.strerror}.")
+            sys.exit(1)
+    policy = observer = None
+    if options['plugin'] is not None or options['profile']:
+        from burstSim import ProfileObserver, load_policy
+        try:
+            policy = options['plugin'] and load_policy(options['plugin'])
+        except ValueError as e:
+            print(f"Error: {e}.")
+            sys.exit(1)
+        observer = ProfileObserver() if options['profile'] else None
+    simulator = SchedulerSimulator(job_file, algorithm, quantum, levels=options['levels'],
+                                   level_quanta=options['level_quanta'], boost=options['boost'],
+                                   allotment=options['allotment'], latency=options['latency'],
+                                   granularity=options['granularity'], seed=options['seed'],
+                                   horizon=options['horizon'], events=options['events'],
+                                   switch_cost=options['switch'], warmup=options['warmup'],
+                                   aging=options['aging'], timeline=timeline, policy=policy, observer=observer)
+    checkpoint = None
+    if options['checkpoint'] is not None:
+        from schedCheckpoint import CHECKPOINT_INTERVAL, Checkpointer, run_key
+        parameters = dict(simulator.policy_parameters(), switch=options['switch'], warmup=options['warmup'])
+        checkpoint = Checkpointer(options['checkpoint'], run_key(job_file, parameters),
+                                  CHECKPOINT_INTERVAL if options['interval'] is None else options['interval'],
+                                  options['resume'])
+        simulator.checkpoint = checkpoint
+    # Real-time totals and switch counts are not part of what the cache holds, a cache hit
+    # would leave the timeline and profile empty, and plugins are not in the key
+    cache = (ResultCache() if options['cache'] and os.path.isfile(job_file) and algorithm not in REALTIME_POLICIES
+             and not simulator.every_slice and policy is None and observer is None else None)
+    if cache is not None:
+        key = cache.key(job_file, simulator.policy_parameters())
+        metrics = cache.load(key)
+        if metrics is not None:
+            simulator.print_results(metrics)
+            return
+
     simulator.read_file()
     simulator.assign_job_ids()    
-    simulator.simulate()
+    if checkpoint is None:
+        simulator.simulate()
+    else:
+        from schedCheckpoint import CheckpointError
+        try:
+            simulator.simulate()
+        except (CheckpointError, OSError) as e:
+            print(f"Error: {e}.")
+            sys.exit(1)
+        checkpoint.finish()  # Results are in memory; a later --resume starts over
+    if cache is not None and len(simulator.jobs):
+        metrics = simulator.job_metrics()
+        cache.store(key, *metrics)
+        simulator.print_results(metrics)
+        return
     simulator.print_results()
+    if timeline is not None:
+        timeline.close()
+    if observer is not None:
+        observer.print_report()
 
 if __name__ == "__main__":
+    sys.modules['schedSim'] = sys.modules[__name__]  # Sibling modules import this script by name
     main()
\ No newline at end of file
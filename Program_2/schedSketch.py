@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# schedSketch.py
+# Mergeable quantile sketches for schedSim's tail metrics. A sketch is a stack of
+# compactors in the KLL style: level h holds values that each stand for 2**h jobs, and a
+# full level is sorted and every other value promoted to the next. Unlike plain KLL, each
+# compaction leaves the top half of the level where it is, so the largest values are
+# kept longest and high percentiles like p99.9 stay sharp while the median drifts by
+# about 1/k of the rank. The offset of the values promoted alternates per level rather
+# than coming from a random draw, so the same jobs always give the same percentiles.
+#
+# Memory is k values per level, about k * log2(n / k) in all. Counts, totals and the
+# extremes are exact, and up to k values every percentile is.
+import math
+
+SKETCH_K = 1024  # Values held per level
+
+def nearest_rank(count, fraction): # 1-based rank of a percentile, rounding fraction to 0.01%
+    return max(1, -(-count * round(fraction * 10000) // 10000))
+
+class QuantileSketch:
+    def __init__(self, k=SKETCH_K):
+        self.k = k
+        self.levels = [[]]
+        self.offsets = [0]  # Which of each sorted pair the next compaction promotes
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.count == 1:
+            self.minimum = self.maximum = value
+        elif value < self.minimum:
+            self.minimum = value
+        elif value > self.maximum:
+            self.maximum = value
+        level = self.levels[0]
+        level.append(value)
+        if len(level) >= self.k:
+            self.compress()
+
+    def extend(self, values): # Any sequence; compacts as it goes, so memory stays bounded
+        for first in range(0, len(values), self.k):
+            chunk = values[first:first + self.k]
+            if not isinstance(chunk, list):
+                chunk = chunk.tolist()
+            if not chunk:
+                continue
+            low, high = min(chunk), max(chunk)
+            if self.count == 0:
+                self.minimum, self.maximum = low, high
+            else:
+                self.minimum, self.maximum = min(self.minimum, low), max(self.maximum, high)
+            self.count += len(chunk)
+            self.total += math.fsum(chunk) if isinstance(low, float) else sum(chunk)
+            self.levels[0].extend(chunk)
+            if len(self.levels[0]) >= self.k:
+                self.compress()
+
+    def merge(self, other): # Folds in another sketch, as if its values had been added here
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.minimum, self.maximum = other.minimum, other.maximum
+        else:
+            self.minimum, self.maximum = min(self.minimum, other.minimum), max(self.maximum, other.maximum)
+        self.count += other.count
+        self.total += other.total
+        for height, values in enumerate(other.levels):
+            if height == len(self.levels):
+                self.levels.append([])
+                self.offsets.append(0)
+            self.levels[height].extend(values)
+        self.compress()
+
+    def compress(self):
+        height = 0
+        while height < len(self.levels):
+            level = self.levels[height]
+            if len(level) >= self.k:
+                level.sort()
+                promoted = (len(level) - self.k // 2) & ~1  # An even number of the smallest
+                if height + 1 == len(self.levels):
+                    self.levels.append([])
+                    self.offsets.append(0)
+                self.levels[height + 1].extend(level[self.offsets[height]:promoted:2])
+                self.offsets[height] ^= 1
+                del level[:promoted]
+            height += 1
+
+    def quantiles(self, fractions): # Nearest-rank percentiles, each fraction in (0, 1]
+        if self.count == 0:
+            return [0.0] * len(fractions)
+        weighted = sorted((value, 1 << height) for height, level in enumerate(self.levels) for value in level)
+        results = []
+        for fraction in fractions:
+            rank = nearest_rank(self.count, fraction)
+            seen = 0
+            for value, weight in weighted:
+                seen += weight
+                if seen >= rank:
+                    break
+            results.append(value)
+        return results
+
+    def mean(self):
+        return float(self.total) / self.count if self.count else 0.0
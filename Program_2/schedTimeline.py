@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# schedTimeline.py
+# Gantt timelines for schedSim. The recorder keeps what the CPU ran as run-length
+# segments (job, start, length): a slice that carries on the previous segment's job with
+# no gap just lengthens it, so memory follows the number of context switches rather than
+# the time simulated, and full blocks of segments are flushed to the output as they fill.
+# A timeline file renders as a text strip like the README's "[P0][P0][P4]" or as SVG.
+#
+#   binary:  magic (8s) | version (u32) | reserved (u32) | segment count (u64)
+#            then one (job, start, length) little-endian int64 triple per segment
+#   csv:     a "job,start,length" header, then one segment per line
+import os
+import sys
+import struct
+import tempfile
+from array import array
+
+TIMELINE_MAGIC = b'SCHEDGNT'
+TIMELINE_VERSION = 1
+TIMELINE_HEADER = struct.Struct('<8sIIQ')
+SEGMENT_BLOCK = 65536  # Segments buffered before a flush
+TEXT_SPAN = 200  # Longer timelines print each segment once, with its length
+SVG_WIDTH = 1000
+SVG_ROW = 16
+SVG_LABEL = 48
+SVG_ROWS = 64  # More jobs than this share one lane, told apart by colour
+
+class TimelineError(Exception):
+    pass
+
+class TimelineRecorder:
+    # Output by extension: .csv and anything else but .svg are written as segments are
+    # flushed. For .svg, or '-' for a text strip on stdout, segments go to a scratch
+    # binary file that close() renders
+    def __init__(self, path, block=SEGMENT_BLOCK):
+        self.path = path
+        self.render = 'svg' if path.endswith('.svg') else 'text' if path == '-' else None
+        if self.render:
+            handle, self.file_path = tempfile.mkstemp(suffix='.bin')
+            os.close(handle)
+        else:
+            self.file_path = path
+        self.csv = self.file_path.endswith('.csv')
+        self.file = open(self.file_path, 'w' if self.csv else 'wb')
+        self.file.write("job,start,length\n" if self.csv else TIMELINE_HEADER.pack(TIMELINE_MAGIC, TIMELINE_VERSION, 0, 0))
+        self.block = block
+        self.jobs, self.starts, self.lengths = array('q'), array('q'), array('q')
+        self.count = 0  # Segments flushed so far
+        self.last_job = None
+        self.end = None  # Where the last segment ends
+
+    def record(self, job, start, length):
+        if length <= 0:
+            return
+        if job == self.last_job and start == self.end:
+            self.lengths[-1] += length
+        else:
+            if len(self.jobs) >= self.block:
+                self.flush(keep=1)  # The last segment may still grow
+            self.jobs.append(job)
+            self.starts.append(start)
+            self.lengths.append(length)
+            self.last_job = job
+        self.end = start + length
+
+    def flush(self, keep=0):
+        count = len(self.jobs) - keep
+        if count <= 0:
+            return
+        if self.csv:
+            self.file.write("".join(f"{j},{s},{n}\n" for j, s, n in
+                                    zip(self.jobs[:count], self.starts[:count], self.lengths[:count])))
+        else:
+            triples = array('q', bytes(24 * count))
+            triples[0::3] = self.jobs[:count]
+            triples[1::3] = self.starts[:count]
+            triples[2::3] = self.lengths[:count]
+            if sys.byteorder != 'little':
+                triples.byteswap()
+            self.file.write(memoryview(triples).cast('B'))
+        self.count += count
+        del self.jobs[:count], self.starts[:count], self.lengths[:count]
+
+    def close(self):
+        self.flush()
+        if not self.csv:
+            self.file.seek(0)
+            self.file.write(TIMELINE_HEADER.pack(TIMELINE_MAGIC, TIMELINE_VERSION, 0, self.count))
+        self.file.close()
+        if self.render:
+            try:
+                if self.render == 'svg':
+                    render_svg(self.file_path, self.path)
+                else:
+                    render_text(self.file_path, sys.stdout)
+            finally:
+                os.remove(self.file_path)
+
+def read_segments(path): # Yields (job, start, length) from a binary or CSV timeline
+    if path.endswith('.csv'):
+        with open(path, 'r') as file:
+            for line in file:
+                parts = line.split(',')
+                if len(parts) == 3 and parts[0].strip().lstrip('-').isdigit():
+                    yield tuple(map(int, parts))
+        return
+
+    with open(path, 'rb') as file:
+        header = file.read(TIMELINE_HEADER.size)
+        if len(header) < TIMELINE_HEADER.size:
+            raise TimelineError(f"'{path}' is too short for a timeline header")
+        magic, version, _, count = TIMELINE_HEADER.unpack(header)
+        if magic != TIMELINE_MAGIC or version != TIMELINE_VERSION:
+            raise TimelineError(f"'{path}' is not a version {TIMELINE_VERSION} timeline")
+        while count:
+            triples = array('q')
+            try:
+                triples.fromfile(file, 3 * min(count, SEGMENT_BLOCK))
+            except EOFError:
+                raise TimelineError(f"'{path}' is truncated: header says more segments")
+            if sys.byteorder != 'little':
+                triples.byteswap()
+            yield from zip(triples[0::3], triples[1::3], triples[2::3])
+            count -= len(triples) // 3
+
+def timeline_extent(path): # (highest job index, end of the last segment)
+    jobs, end = -1, 0
+    for job, start, length in read_segments(path):
+        jobs = max(jobs, job)
+        end = max(end, start + length)
+    return jobs, end
+
+def render_text(path, out):
+    # One [Pn] per time unit, [--] while idle, or one per segment with its length once
+    # the timeline is longer than TEXT_SPAN
+    _, end = timeline_extent(path)
+    expand = end <= TEXT_SPAN
+    clock = 0
+    parts = []
+    for job, start, length in read_segments(path):
+        if start > clock:
+            parts.append("[--]" * (start - clock) if expand else f"[--]x{start - clock}")
+        parts.append(f"[P{job}]" * length if expand or length == 1 else f"[P{job}]x{length}")
+        clock = start + length
+    out.write("".join(parts) + "\n")
+
+def render_svg(path, svg_path):
+    jobs, end = timeline_extent(path)
+    lanes = jobs + 1 if jobs < SVG_ROWS else 1
+    scale = (SVG_WIDTH - SVG_LABEL) / max(end, 1)
+    height = lanes * SVG_ROW + SVG_ROW
+    with open(svg_path, 'w') as svg:
+        svg.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{SVG_WIDTH}" height="{height}" '
+                  f'font-family="monospace" font-size="{SVG_ROW - 4}">\n')
+        for lane in range(lanes):
+            label = f"P{lane}" if lanes > 1 else "CPU"
+            svg.write(f'<text x="2" y="{(lane + 1) * SVG_ROW - 4}">{label}</text>\n')
+        for job, start, length in read_segments(path):
+            lane = job if lanes > 1 else 0
+            hue = job * 137 % 360  # Golden-angle steps keep neighbouring jobs apart
+            svg.write(f'<rect x="{SVG_LABEL + start * scale:.2f}" y="{lane * SVG_ROW + 1}" '
+                      f'width="{max(length * scale, 0.5):.2f}" height="{SVG_ROW - 2}" fill="hsl({hue},60%,55%)">'
+                      f'<title>P{job} {start}-{start + length}</title></rect>\n')
+        svg.write(f'<text x="{SVG_LABEL}" y="{height - 3}">0</text>'
+                  f'<text x="{SVG_WIDTH - 2}" y="{height - 3}" text-anchor="end">{end}</text>\n</svg>\n')
+
+def main():
+    if len(sys.argv) not in (2, 3):
+        print("Usage: schedTimeline.py <timeline.bin|timeline.csv> [<chart.svg>]")
+        sys.exit(1)
+    try:
+        if len(sys.argv) == 3:
+            render_svg(sys.argv[1], sys.argv[2])
+        else:
+            render_text(sys.argv[1], sys.stdout)
+    except FileNotFoundError:
+        print(f"Error: File '{sys.argv[1]}' not found.")
+        sys.exit(1)
+    except (TimelineError, ValueError) as e:
+        print(f"Error: {e}.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# smpSim.py
+# Multi-CPU scheduling on top of schedSim. Every CPU runs the chosen policy over its own
+# run queue, a load balancer places each arriving job on a CPU and lets idle CPUs pull
+# waiting work from busier ones, and the whole machine advances from one event (an
+# arrival or the end of a slice) to the next instead of ticking every CPU.
+import heapq
+import random
+from collections import deque
+
+from schedSim import ScheduleType, SchedulerSimulator
+
+SMP_POLICIES = {ScheduleType.FIFO, ScheduleType.SRTN, ScheduleType.RR}  # Policies each CPU can run
+
+class Processor:
+    def __init__(self, cpu_id, algorithm):
+        self.id = cpu_id
+        # SRTN keeps a (remaining_time, job_index) heap, FIFO and RR a plain queue
+        self.queue = [] if algorithm == ScheduleType.SRTN else deque()
+        self.job = None  # Job index currently running, None when idle
+        self.last_job = None  # Job whose state the CPU holds
+        self.slice_start = 0  # Past any switch overhead, when the job itself starts running
+        self.version = 0  # Bumped on preemption so stale events are skipped
+        self.busy_time = 0
+        self.completed = 0
+        self.switches = 0
+        self.overhead = 0
+
+class LoadBalancer:
+    # Placement and migration policy. place() picks the CPU for an arriving job and
+    # steal() names a CPU an idle one may take a waiting job from (None to stay idle)
+    steals = False
+
+    def place(self, sim, job_index):
+        return 0
+
+    def steal(self, sim, cpu):
+        return None
+
+class RoundRobinBalancer(LoadBalancer): # Deal arrivals out in turn, never migrate
+    def __init__(self):
+        self.next_cpu = 0
+
+    def place(self, sim, job_index):
+        cpu = self.next_cpu
+        self.next_cpu = (cpu + 1) % len(sim.cpus)
+        return cpu
+
+class LeastLoadedBalancer(LoadBalancer): # Join the least-loaded CPU, idle CPUs pull from the busiest
+    steals = True
+
+    def place(self, sim, job_index):
+        return min(range(len(sim.loads)), key=sim.loads.__getitem__)
+
+    def steal(self, sim, cpu):
+        victim = max(range(len(sim.loads)), key=sim.loads.__getitem__)
+        return victim if sim.cpus[victim].queue else None
+
+class RandomBalancer(LoadBalancer): # Random placement, idle CPUs pull from a random CPU
+    steals = True
+
+    def __init__(self, seed=0):
+        self.random = random.Random(seed)
+
+    def place(self, sim, job_index):
+        return self.random.randrange(len(sim.cpus))
+
+    def steal(self, sim, cpu):
+        victim = self.random.randrange(len(sim.cpus))
+        return victim if sim.cpus[victim].queue else None
+
+BALANCERS = {
+    'least': LeastLoadedBalancer,
+    'rr': RoundRobinBalancer,
+    'random': RandomBalancer,
+}
+
+class SMPSimulator(SchedulerSimulator):
+    def __init__(self, job_file, algorithm=ScheduleType.FIFO, quantum=1, cpus=1, balancer='least',
+                 switch_cost=0, warmup=0):
+        super().__init__(job_file, algorithm, quantum, switch_cost=switch_cost, warmup=warmup)
+        self.cpu_count = cpus
+        self.balancer_name = balancer
+        self.balancer = None
+        self.cpus = []
+        self.loads = []  # Per CPU: queued jobs plus the running one
+        self.events = []  # heap of (time, cpu id, cpu version, slice end or switch done)
+        self.idle = set()  # CPUs with nothing to run
+        self.waiting = 0  # Jobs sitting in any run queue
+        self.migrations = 0
+
+    def simulate(self):
+        if not self.jobs:
+            return
+
+        self.jobs.reset()
+        self.current_time = 0
+        self.completed_jobs = 0
+        self.next_arrival = 0
+        self.balancer = BALANCERS[self.balancer_name]()
+        self.cpus = [Processor(cpu_id, self.algorithm) for cpu_id in range(self.cpu_count)]
+        self.loads = [0] * self.cpu_count
+        self.events = []
+        self.idle = set(range(self.cpu_count))
+        self.waiting = 0
+        self.migrations = 0
+        self.switches = 0
+        self.overhead = 0
+
+        job_count = len(self.jobs)
+        while self.completed_jobs < job_count:
+            next_event = self.events[0][0] if self.events else float('inf')
+            self.current_time = min(next_event, self.arriving_job())
+            if self.current_time == float('inf'):
+                break  # No more jobs
+
+            # Arrivals are queued before preempted jobs rejoin, as on a single CPU
+            woken = []
+            for i in self.admit_arrivals():
+                cpu = self.cpus[self.balancer.place(self, i)]
+                self.enqueue(cpu, i)
+                woken.append(cpu)
+            while self.events and self.events[0][0] == self.current_time:
+                _, cpu_id, version, slice_end = heapq.heappop(self.events)
+                cpu = self.cpus[cpu_id]
+                if version != cpu.version:
+                    continue
+                if slice_end:
+                    self.end_slice(cpu)
+                    woken.append(cpu)
+                elif self.outranked(cpu):
+                    self.preempt(cpu)  # A job that arrived during the switch goes first
+                    woken.append(cpu)
+                else:
+                    self.start_slice(cpu)
+
+            for cpu in woken:
+                if cpu.job is None:
+                    self.dispatch(cpu)
+            if self.waiting and self.idle and self.balancer.steals:
+                for cpu_id in sorted(self.idle):
+                    self.dispatch(self.cpus[cpu_id])
+                    if not self.waiting:
+                        break
+
+    def enqueue(self, cpu, job_index):
+        jobs = self.jobs
+        if self.algorithm == ScheduleType.SRTN:
+            running = cpu.job
+            # A switch in progress runs to the end, where outranked() has another look
+            if running is not None and self.current_time >= cpu.slice_start:
+                left = jobs.remaining_time[running] - max(0, self.current_time - cpu.slice_start)
+                if (jobs.remaining_time[job_index], job_index) < (left, running):
+                    self.preempt(cpu)
+            heapq.heappush(cpu.queue, (jobs.remaining_time[job_index], job_index))
+        else:
+            cpu.queue.append(job_index)
+        self.loads[cpu.id] += 1
+        self.waiting += 1
+
+    def preempt(self, cpu):
+        job_index = cpu.job
+        self.charge(cpu)
+        heapq.heappush(cpu.queue, (self.jobs.remaining_time[job_index], job_index))
+        self.waiting += 1
+        cpu.version += 1
+
+    def charge(self, cpu): # Bills the running job for the slice so far and frees the CPU
+        ran = max(0, self.current_time - cpu.slice_start)  # Nothing if preempted as the switch ends
+        cpu.busy_time += ran
+        self.jobs.remaining_time[cpu.job] -= ran
+        cpu.job = None
+
+    def dispatch(self, cpu):
+        source = cpu
+        if not cpu.queue:
+            victim = self.balancer.steal(self, cpu)
+            if victim is None:
+                self.idle.add(cpu.id)
+                return
+            source = self.cpus[victim]
+            self.loads[victim] -= 1
+            self.loads[cpu.id] += 1
+            self.migrations += 1
+
+        if self.algorithm == ScheduleType.SRTN:
+            _, job_index = heapq.heappop(source.queue)
+        else:
+            job_index = source.queue.popleft()
+        self.waiting -= 1
+        self.idle.discard(cpu.id)
+
+        jobs = self.jobs
+        cpu.job = job_index
+        cpu.slice_start = self.current_time
+        if self.costs and job_index != cpu.last_job:
+            self.switch_to(cpu, job_index)
+        if cpu.slice_start > self.current_time and self.algorithm == ScheduleType.SRTN:
+            heapq.heappush(self.events, (cpu.slice_start, cpu.id, cpu.version, False))
+        else:
+            self.start_slice(cpu)
+
+    def outranked(self, cpu): # Whether a queued job is now shorter than the one switched in
+        jobs = self.jobs
+        return bool(cpu.queue) and cpu.queue[0] < (jobs.remaining_time[cpu.job], cpu.job)
+
+    def start_slice(self, cpu):
+        jobs = self.jobs
+        job_index = cpu.job
+        if jobs.start_time[job_index] == -1:
+            jobs.start_time[job_index] = cpu.slice_start
+        run_time = jobs.remaining_time[job_index]
+        if self.algorithm == ScheduleType.RR:
+            run_time = min(self.quantum, run_time)
+        heapq.heappush(self.events, (cpu.slice_start + run_time, cpu.id, cpu.version, True))
+
+    def switch_to(self, cpu, job_index): # Loading a job someone else ran last, or a migrated one
+        overhead = self.switch_cost
+        if self.jobs.start_time[job_index] != -1:
+            overhead += self.warmup
+        cpu.slice_start += overhead
+        cpu.overhead += overhead
+        cpu.switches += 1
+        cpu.last_job = job_index
+        self.overhead += overhead
+        self.switches += 1
+
+    def end_slice(self, cpu):
+        job_index = cpu.job
+        self.charge(cpu)
+        if self.jobs.remaining_time[job_index] == 0:
+            self.jobs.finish_time[job_index] = self.current_time
+            self.completed_jobs += 1
+            self.loads[cpu.id] -= 1
+            cpu.completed += 1
+        else:
+            cpu.queue.append(job_index)  # Only RR slices end early
+            self.waiting += 1
+
+    def print_results(self, metrics=None):
+        super().print_results(metrics)
+        for cpu in self.cpus:
+            utilization = 100.0 * cpu.busy_time / self.current_time if self.current_time else 0.0
+            print(f"CPU {cpu.id:3d} -- Utilization {utilization:3.2f}%  Completed {cpu.completed}"
+                  + (f"  Switches {cpu.switches}  Overhead {cpu.overhead}" if self.costs else ""))
+        print(f"Migrations {self.migrations}")
+
+    def print_switches(self): # Overhead as a share of the time on every CPU
+        capacity = self.current_time * len(self.cpus)
+        share = 100.0 * self.overhead / capacity if capacity else 0.0
+        print(f"Switches -- Count {self.switches}  Overhead {self.overhead} ({share:3.2f}%)")